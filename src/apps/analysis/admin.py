@@ -0,0 +1,16 @@
+"""
+Admin configuration for analysis app.
+"""
+
+from django.contrib import admin
+
+from .models import AnalysisJob
+
+
+@admin.register(AnalysisJob)
+class AnalysisJobAdmin(admin.ModelAdmin):
+    """Admin interface for AnalysisJob model."""
+    
+    list_display = ("video", "status", "stage", "current", "total", "created_at")
+    list_filter = ("status", "created_at")
+    readonly_fields = ("created_at", "started_at", "finished_at")
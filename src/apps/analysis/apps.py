@@ -2,7 +2,14 @@
 App configuration for analysis module.
 """
 
+import logging
+import threading
+
 from django.apps import AppConfig
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
 
 
 class AnalysisConfig(AppConfig):
@@ -11,4 +18,29 @@ class AnalysisConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.analysis"
     verbose_name = "Lecture Analysis"
+    
+    def ready(self) -> None:
+        """
+        Connect signal handlers and warm the shared analysis models in the
+        background if enabled.
+        """
+        from . import signals  # noqa: F401
+        
+        if settings.PRELOAD_MODELS:
+            threading.Thread(
+                target=warm_models, name="model-warmup", daemon=True
+            ).start()
 
+
+def warm_models() -> None:
+    """Load the shared analysis services into the model registry."""
+    from core.services import LectureAnalyzer, model_registry
+    
+    try:
+        LectureAnalyzer().warm_up()
+    except Exception:
+        logger.exception("Model warm-up failed")
+        return
+    
+    for stats in model_registry.stats():
+        logger.info("Preloaded %s", stats.to_dict())
@@ -0,0 +1,310 @@
+"""
+Background execution of lecture analysis jobs.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from apps.lectures.models import Lecture, Segment
+from apps.uploads.models import Video
+from core.services import AnalysisResult, LectureAnalyzer
+
+from .models import AnalysisJob
+
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.ANALYSIS_WORKERS,
+    thread_name_prefix="analysis",
+)
+
+# Audio pre-extraction runs on its own worker so it never delays analyses.
+_prepare_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prepare")
+
+# Jobs this process runs; their heartbeat is refreshed in the background.
+_local_jobs: set[int] = set()
+_local_jobs_lock = threading.Lock()
+_heartbeat_pid: int | None = None
+
+
+def start_job(video, force: bool = False) -> AnalysisJob:
+    """
+    Return the active job for a video, or create and enqueue a new one.
+    
+    If an earlier upload with identical content was already analyzed with
+    the current analyzer configuration, a completed job pointing at the
+    stored Lecture is returned instead, unless ``force`` is set.
+    
+    New jobs run on the worker thread pool, or on the async supervisor
+    when ``ANALYSIS_ASYNC`` is enabled. At most one job per video is
+    active; a concurrent request that loses the race gets the winner's job.
+    """
+    fail_interrupted_jobs(video.analysis_jobs.all())
+    job = video.analysis_jobs.filter(status__in=AnalysisJob.ACTIVE_STATUSES).first()
+    if job:
+        return job
+    
+    if not force:
+        cached = find_cached_lecture(video)
+        if cached:
+            now = timezone.now()
+            return AnalysisJob.objects.create(
+                video=video,
+                lecture=cached,
+                status=AnalysisJob.Status.COMPLETED,
+                stage="Loaded cached results",
+                started_at=now,
+                finished_at=now,
+            )
+    
+    try:
+        with transaction.atomic():
+            job = AnalysisJob.objects.create(video=video, owner=_owner())
+    except IntegrityError:
+        return (
+            video.analysis_jobs.filter(status__in=AnalysisJob.ACTIVE_STATUSES).first()
+            or video.analysis_jobs.first()
+        )
+    
+    track_local_job(job.pk)
+    if settings.ANALYSIS_ASYNC:
+        from .supervisor import supervisor
+        
+        transaction.on_commit(lambda: supervisor.submit(job))
+    else:
+        transaction.on_commit(lambda: _executor.submit(run_job, job.pk))
+    return job
+
+
+def start_preparation(video) -> None:
+    """Extract the audio of a new upload in the background once it is committed."""
+    transaction.on_commit(lambda: _prepare_executor.submit(prepare_video, video.pk))
+
+
+def prepare_video(video_id: int) -> None:
+    """
+    Extract a video's audio into the artifact cache ahead of analysis.
+    
+    Skipped if an analysis has already started or a stored result exists.
+    Failures are only logged: the analysis extracts the audio itself if no
+    prepared copy exists.
+    """
+    close_old_connections()
+    try:
+        video = Video.objects.get(pk=video_id)
+        if video.analysis_jobs.exists() or find_cached_lecture(video):
+            return
+        LectureAnalyzer().prepare_audio(
+            settings.MEDIA_ROOT / str(video.video),
+            content_hash=video.content_hash or None,
+        )
+    except Exception:
+        logger.exception("Audio preparation for video %s failed", video_id)
+    finally:
+        close_old_connections()
+
+
+def fail_interrupted_jobs(jobs=None) -> int:
+    """
+    Fail active jobs whose process has died.
+    
+    Jobs only run in the process that created them, so after a crash or
+    restart they would otherwise stay active forever and block new
+    analyses of their video. A job counts as orphaned when its heartbeat
+    is older than ``ANALYSIS_STALE_AFTER_S``, or when its owner is a
+    process on this host that no longer runs it. Jobs of live sibling
+    processes are left alone. Returns the number of jobs failed.
+    """
+    jobs = AnalysisJob.objects.all() if jobs is None else jobs
+    cutoff = timezone.now() - timedelta(seconds=settings.ANALYSIS_STALE_AFTER_S)
+    
+    try:
+        active = jobs.filter(status__in=AnalysisJob.ACTIVE_STATUSES).only("pk", "owner", "updated_at")
+        orphaned = [
+            job.pk for job in active
+            if job.updated_at < cutoff or _owner_is_gone(job.pk, job.owner)
+        ]
+        if not orphaned:
+            return 0
+        count = AnalysisJob.objects.filter(
+            pk__in=orphaned,
+            status__in=AnalysisJob.ACTIVE_STATUSES,
+        ).update(
+            status=AnalysisJob.Status.FAILED,
+            error="Interrupted because its server process stopped",
+            finished_at=timezone.now(),
+        )
+    except DatabaseError:
+        logger.exception("Could not fail interrupted analysis jobs")
+        return 0
+    
+    if count:
+        logger.warning("Failed %d analysis jobs whose process stopped", count)
+    return count
+
+
+def track_local_job(job_id: int) -> None:
+    """Mark a job as run by this process and keep its heartbeat fresh."""
+    global _heartbeat_pid
+    with _local_jobs_lock:
+        _local_jobs.add(job_id)
+        # Threads do not survive a fork, so each worker process starts its own.
+        if _heartbeat_pid != os.getpid():
+            _heartbeat_pid = os.getpid()
+            threading.Thread(target=_heartbeat, name="analysis-heartbeat", daemon=True).start()
+
+
+def untrack_local_job(job_id: int) -> None:
+    """Stop refreshing the heartbeat of a job that has finished."""
+    with _local_jobs_lock:
+        _local_jobs.discard(job_id)
+
+
+def find_cached_lecture(video) -> Lecture | None:
+    """Find a stored analysis of the same file under the same configuration."""
+    if not video.content_hash:
+        return None
+    return Lecture.objects.filter(
+        content_hash=video.content_hash,
+        config_key=LectureAnalyzer().config_fingerprint,
+    ).first()
+
+
+def run_job(job_id: int) -> None:
+    """Execute an analysis job and persist its progress and result."""
+    close_old_connections()
+    track_local_job(job_id)
+    try:
+        job = AnalysisJob.objects.select_related("video").get(pk=job_id)
+        _update(job_id, status=AnalysisJob.Status.RUNNING, started_at=timezone.now())
+        
+        def progress(stage: str, current: int, total: int, metrics=None) -> None:
+            fields = {"stage": stage, "current": current, "total": total}
+            if metrics is not None:
+                fields["partial_metrics"] = metrics.to_dict()
+            try:
+                _update(job_id, **fields)
+            except DatabaseError:
+                # Progress is informational; a failed write must not abort the analysis.
+                logger.warning("Could not save progress of job %s", job_id, exc_info=True)
+        
+        video_path = settings.MEDIA_ROOT / str(job.video.video)
+        analyzer = LectureAnalyzer()
+        result = analyzer.analyze(
+            video_path,
+            progress_callback=progress,
+            content_hash=job.video.content_hash or None,
+        )
+        lecture = save_lecture(
+            job.video.name.title(),
+            result,
+            content_hash=job.video.content_hash,
+            config_key=analyzer.config_fingerprint,
+        )
+        
+        _update(
+            job_id,
+            status=AnalysisJob.Status.COMPLETED,
+            lecture=lecture,
+            finished_at=timezone.now(),
+        )
+    except Exception as exc:
+        logger.exception("Analysis job %s failed", job_id)
+        _update(
+            job_id,
+            status=AnalysisJob.Status.FAILED,
+            error=str(exc) or exc.__class__.__name__,
+            finished_at=timezone.now(),
+        )
+    finally:
+        untrack_local_job(job_id)
+        close_old_connections()
+
+
+def save_lecture(
+    name: str,
+    result: AnalysisResult,
+    content_hash: str = "",
+    config_key: str = "",
+) -> Lecture:
+    """Store the aggregate results of an analysis and its segments."""
+    with transaction.atomic():
+        lecture = Lecture.objects.create(
+            name=name,
+            engagement_ratio=result.metrics.engagement_percentage,
+            tone_modality=result.metrics.tone_modulation_score,
+            questions=result.metrics.question_count,
+            wpm=result.metrics.words_per_minute,
+            suggestion=result.feedback,
+            timeline=result.timeline,
+            content_hash=content_hash,
+            config_key=config_key,
+            segment_count=result.metrics.utterance_count,
+            skipped_segments=result.metrics.silent_count,
+            timings=result.timings,
+        )
+        Segment.objects.bulk_create(
+            (
+                Segment.from_utterance(lecture, index, utterance)
+                for index, utterance in enumerate(result.utterances)
+            ),
+            batch_size=Segment.BATCH_SIZE,
+        )
+    return lecture
+
+
+def _update(job_id: int, **fields) -> None:
+    AnalysisJob.objects.filter(pk=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def _owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_is_gone(job_id: int, owner: str) -> bool:
+    """Whether the owner of a job is known not to be running it any more."""
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        # Jobs of other hosts are only judged by their heartbeat.
+        return False
+    if int(pid) == os.getpid():
+        with _local_jobs_lock:
+            return job_id not in _local_jobs
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+def _heartbeat() -> None:
+    """Refresh the heartbeat of this process's active jobs until it exits."""
+    while True:
+        time.sleep(settings.ANALYSIS_HEARTBEAT_S)
+        with _local_jobs_lock:
+            job_ids = list(_local_jobs)
+        if not job_ids:
+            continue
+        try:
+            AnalysisJob.objects.filter(
+                pk__in=job_ids,
+                status__in=AnalysisJob.ACTIVE_STATUSES,
+            ).update(updated_at=timezone.now())
+        except DatabaseError:
+            logger.warning("Could not refresh analysis job heartbeats", exc_info=True)
+        finally:
+            close_old_connections()
@@ -0,0 +1,63 @@
+"""
+Compare emotion inference backends against the reference pipeline.
+
+Usage:
+    python manage.py emotion_parity data/parity/
+    python manage.py emotion_parity clip1.wav clip2.wav --backends torch-int8 onnx
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.emotion_backends import BACKENDS
+from core.services.emotion_parity import run_parity
+
+
+AUDIO_SUFFIXES = {".wav", ".flac", ".mp3", ".ogg"}
+
+
+class Command(BaseCommand):
+    help = "Report label agreement and score drift of emotion backends on a fixed audio set."
+    
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Audio files or directories")
+        parser.add_argument(
+            "--backends",
+            nargs="+",
+            default=list(BACKENDS),
+            choices=list(BACKENDS),
+        )
+        parser.add_argument("--batch-size", type=int, default=8)
+    
+    def handle(self, *args, **options):
+        audio_paths = []
+        for path in map(Path, options["paths"]):
+            if path.is_dir():
+                audio_paths.extend(sorted(
+                    p for p in path.iterdir() if p.suffix.lower() in AUDIO_SUFFIXES
+                ))
+            elif path.exists():
+                audio_paths.append(path)
+            else:
+                raise CommandError(f"No such file or directory: {path}")
+        
+        if not audio_paths:
+            raise CommandError("No audio files found")
+        
+        reports = run_parity(
+            audio_paths,
+            backends=options["backends"],
+            batch_size=options["batch_size"],
+        )
+        
+        self.stdout.write(
+            f"{'backend':<12} {'samples':>7} {'agreement':>10} "
+            f"{'mean drift':>11} {'max drift':>10} {'s/sample':>9}"
+        )
+        for report in reports:
+            self.stdout.write(
+                f"{report.backend:<12} {report.sample_count:>7} "
+                f"{report.label_agreement:>10.2%} {report.mean_score_drift:>11.5f} "
+                f"{report.max_score_drift:>10.5f} {report.seconds_per_sample:>9.3f}"
+            )
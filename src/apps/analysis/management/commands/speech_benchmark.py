@@ -0,0 +1,83 @@
+"""
+Measure Speech API payload size and latency against a local fake server.
+
+Usage:
+    python manage.py speech_benchmark lecture.mp4 --chunks 10
+"""
+
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from google.cloud import speech
+
+from core.services import AnalysisWorkspace, AudioProcessor, SpeechPayload, prepare_payload
+from core.services.speech_fake import FakeSpeechServer
+
+
+class Command(BaseCommand):
+    help = "Compare raw, downmixed/resampled and FLAC Speech payloads on a fake server."
+    
+    def add_arguments(self, parser):
+        parser.add_argument("video", help="Video or audio file to sample chunks from")
+        parser.add_argument("--chunks", type=int, default=10)
+        parser.add_argument(
+            "--bandwidth",
+            type=float,
+            default=2_500_000,
+            help="Simulated upload bandwidth in bytes per second",
+        )
+    
+    def handle(self, *args, **options):
+        video_path = Path(options["video"])
+        if not video_path.exists():
+            raise CommandError(f"No such file: {video_path}")
+        
+        with AnalysisWorkspace() as workspace:
+            processor = AudioProcessor(temp_dir=workspace.path, sample_rate=44100, channels=2)
+            chunks = []
+            for chunk in processor.stream_audio(video_path):
+                chunks.append(chunk)
+                if len(chunks) >= options["chunks"]:
+                    break
+        
+        if not chunks:
+            raise CommandError("The file is shorter than one chunk")
+        
+        variants = {
+            "LINEAR16 44.1 kHz stereo": lambda chunk: SpeechPayload(
+                content=chunk.to_pcm_bytes(),
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate=chunk.sample_rate,
+                channels=chunk.channels,
+            ),
+            "LINEAR16 16 kHz mono": lambda chunk: prepare_payload(chunk, 16000, "LINEAR16"),
+            "FLAC 16 kHz mono": lambda chunk: prepare_payload(chunk, 16000, "FLAC"),
+        }
+        
+        self.stdout.write(f"{'payload':<26} {'bytes/chunk':>12} {'s/chunk':>8}")
+        
+        with FakeSpeechServer(bandwidth_bytes_per_s=options["bandwidth"]) as server:
+            client = server.client()
+            
+            for name, build in variants.items():
+                server.reset()
+                started = time.perf_counter()
+                
+                for chunk in chunks:
+                    payload = build(chunk)
+                    client.recognize(
+                        config=speech.RecognitionConfig(
+                            encoding=payload.encoding,
+                            language_code="en-US",
+                            sample_rate_hertz=payload.sample_rate,
+                            audio_channel_count=payload.channels,
+                        ),
+                        audio=speech.RecognitionAudio(content=payload.content),
+                    )
+                
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{name:<26} {server.total_payload_bytes // len(chunks):>12} "
+                    f"{elapsed / len(chunks):>8.3f}"
+                )
@@ -0,0 +1,82 @@
+"""
+Exercise the shared transcription client against a local fake server.
+
+Usage:
+    python manage.py speech_load_test --requests 200 --failure-rate 0.1
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from google.cloud import speech
+
+from core.services import AudioChunk, Config
+from core.services.speech import prepare_payload
+from core.services.speech_client import TranscriptionClient
+from core.services.speech_fake import FakeSpeechServer
+
+
+class Command(BaseCommand):
+    help = "Measure throughput, concurrency and retry behavior of the transcription client."
+    
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=100)
+        parser.add_argument("--callers", type=int, default=16, help="Concurrent caller threads")
+        parser.add_argument("--failure-rate", type=float, default=0.0)
+        parser.add_argument("--latency", type=float, default=0.2, help="Base server latency in seconds")
+        parser.add_argument("--rps", type=float, default=Config.speech_requests_per_second)
+        parser.add_argument("--concurrency", type=int, default=Config.speech_max_concurrency)
+        parser.add_argument("--attempts", type=int, default=Config.speech_max_attempts)
+    
+    def handle(self, *args, **options):
+        chunk = AudioChunk(
+            start_time_ms=0,
+            end_time_ms=30000,
+            samples=np.zeros((16000 * 30, 1), dtype=np.int16),
+            sample_rate=16000,
+            channels=1,
+        )
+        payload = prepare_payload(chunk)
+        recognition_config = speech.RecognitionConfig(
+            encoding=payload.encoding,
+            language_code="en-US",
+            sample_rate_hertz=payload.sample_rate,
+            audio_channel_count=payload.channels,
+        )
+        recognition_audio = speech.RecognitionAudio(content=payload.content)
+        
+        with FakeSpeechServer(
+            base_latency_s=options["latency"],
+            bandwidth_bytes_per_s=None,
+            max_workers=max(options["concurrency"], 1) * 2,
+            failure_rate=options["failure_rate"],
+        ) as server:
+            client = TranscriptionClient(
+                server.client(),
+                requests_per_second=options["rps"],
+                max_concurrency=options["concurrency"],
+                max_attempts=options["attempts"],
+            )
+            
+            def call(_):
+                try:
+                    client.recognize(config=recognition_config, audio=recognition_audio)
+                    return True
+                except Exception:
+                    return False
+            
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["callers"]) as pool:
+                outcomes = list(pool.map(call, range(options["requests"])))
+            elapsed = time.perf_counter() - started
+        
+        succeeded = sum(outcomes)
+        self.stdout.write(f"Requests:         {options['requests']} in {elapsed:.2f}s")
+        self.stdout.write(f"Throughput:       {succeeded / elapsed:.2f} successful req/s")
+        self.stdout.write(f"Succeeded:        {succeeded}")
+        self.stdout.write(f"Failed:           {options['requests'] - succeeded}")
+        self.stdout.write(f"Client stats:     {client.stats.to_dict()}")
+        self.stdout.write(f"Injected errors:  {server.failure_count}")
+        self.stdout.write(f"Max in flight:    {server.max_in_flight}")
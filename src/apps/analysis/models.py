@@ -0,0 +1,135 @@
+"""
+Models for background lecture analysis jobs.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+from apps.lectures.models import Lecture
+from apps.uploads.models import Video
+
+
+class AnalysisJob(models.Model):
+    """
+    Tracks a lecture analysis running outside the request cycle.
+    
+    Attributes:
+        video: The uploaded video being analyzed.
+        lecture: The saved analysis once the job completes.
+        status: Lifecycle state of the job.
+        stage: Current pipeline stage reported by the analyzer.
+        current: Units of work completed in the current stage.
+        total: Units of work expected in the current stage.
+        error: Failure message if the job failed.
+        partial_metrics: Metrics of the segments analyzed so far.
+        owner: Host and process id of the server process running the job.
+        updated_at: Heartbeat refreshed by the owning process while the
+            job is active.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        COMPLETED = "completed", "Completed"
+        FAILED = "failed", "Failed"
+    
+    ACTIVE_STATUSES = (Status.PENDING, Status.RUNNING)
+    
+    video = models.ForeignKey(
+        Video,
+        on_delete=models.CASCADE,
+        related_name="analysis_jobs",
+        help_text="The video being analyzed",
+    )
+    lecture = models.ForeignKey(
+        Lecture,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="The analysis result once the job completes",
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        help_text="Lifecycle state of the job",
+    )
+    stage = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Current pipeline stage",
+    )
+    current = models.PositiveIntegerField(
+        default=0,
+        help_text="Completed units of work in the current stage",
+    )
+    total = models.PositiveIntegerField(
+        default=0,
+        help_text="Expected units of work in the current stage",
+    )
+    error = models.TextField(
+        blank=True,
+        default="",
+        help_text="Failure message, if any",
+    )
+    partial_metrics = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Metrics of the segments analyzed so far",
+    )
+    owner = models.CharField(
+        max_length=128,
+        blank=True,
+        default="",
+        help_text="host:pid of the process running the job",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Analysis Job"
+        verbose_name_plural = "Analysis Jobs"
+        indexes = [
+            models.Index(fields=["video", "status"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["video"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="analysisjob_one_active_per_video",
+            ),
+        ]
+    
+    def __str__(self) -> str:
+        return f"Job {self.pk} for {self.video} ({self.status})"
+    
+    @property
+    def is_active(self) -> bool:
+        return self.status in self.ACTIVE_STATUSES
+    
+    @property
+    def eta_seconds(self) -> int | None:
+        """Estimated seconds remaining, extrapolated from progress so far."""
+        if self.status != self.Status.RUNNING or not self.started_at:
+            return None
+        if not self.current or self.total <= self.current:
+            return None
+        elapsed = (timezone.now() - self.started_at).total_seconds()
+        return round(elapsed / self.current * (self.total - self.current))
+    
+    def to_status_dict(self) -> dict:
+        """Serialize the job progress for the status endpoint."""
+        return {
+            "status": self.status,
+            "stage": self.stage,
+            "current": self.current,
+            "total": self.total,
+            "eta_seconds": self.eta_seconds,
+            "error": self.error,
+            "metrics": self.partial_metrics,
+        }
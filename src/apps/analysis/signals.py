@@ -0,0 +1,26 @@
+"""
+Signal handlers for lecture analysis.
+"""
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.uploads.models import Video
+
+from .jobs import fail_interrupted_jobs, start_preparation
+
+
+@receiver(post_save, sender=Video)
+def prepare_uploaded_video(sender, instance: Video, created: bool, **kwargs) -> None:
+    """Start extracting a new upload's audio while the user previews it."""
+    if created and settings.PREPARE_AUDIO_ON_UPLOAD:
+        start_preparation(instance)
+
+
+@receiver(request_started, dispatch_uid="fail_interrupted_jobs")
+def fail_jobs_on_first_request(sender, **kwargs) -> None:
+    """Clean up jobs orphaned by a stopped process once the database is in use."""
+    request_started.disconnect(dispatch_uid="fail_interrupted_jobs")
+    fail_interrupted_jobs()
@@ -0,0 +1,195 @@
+"""
+Asyncio supervisor running many lecture analyses on one event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+from core.services import LectureAnalyzer
+
+from .jobs import save_lecture, track_local_job, untrack_local_job
+from .models import AnalysisJob
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobChannel:
+    """
+    Live state of one supervised job and the listeners waiting on it.
+    
+    The supervisor updates an in-memory copy of the job as progress is
+    reported; listeners on any event loop are woken on every change.
+    """
+    
+    def __init__(self, job: AnalysisJob) -> None:
+        self.job = job
+        self.version = 0
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+    
+    def update(self, **fields) -> None:
+        """Apply field changes to the live job and wake all listeners."""
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self.job, name, value)
+            self.version += 1
+            waiters, self._waiters = self._waiters, []
+        
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+    
+    def status(self) -> tuple[int, dict]:
+        """Return the current version and status dict."""
+        with self._lock:
+            return self.version, self.job.to_status_dict()
+    
+    async def wait(self, version: int, timeout: float) -> tuple[int, dict]:
+        """Wait until the job changes after ``version`` or ``timeout`` expires."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.version == version:
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+            else:
+                future = None
+        
+        if future is not None:
+            try:
+                await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.status()
+
+
+class AnalysisSupervisor:
+    """
+    Runs analysis jobs as tasks on an event loop in a background thread.
+    
+    Each job awaits ``LectureAnalyzer.analyze_async``, so waiting on the
+    Speech and OpenAI APIs costs no threads and one process can supervise
+    many analyses; at most ``ANALYSIS_ASYNC_MAX_JOBS`` run at once. Progress
+    is published through a JobChannel for the event stream and written to
+    the database at most once per ``PERSIST_INTERVAL_S``.
+    """
+    
+    PERSIST_INTERVAL_S = 1.0
+    
+    def __init__(self, max_jobs: int) -> None:
+        self.max_jobs = max_jobs
+        self._channels: dict[int, JobChannel] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._lock = threading.Lock()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The supervisor's event loop, started on first use."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="analysis-supervisor",
+                    daemon=True,
+                ).start()
+            return self._loop
+    
+    def submit(self, job: AnalysisJob) -> None:
+        """Schedule a pending job; safe to call from any thread."""
+        self._channels[job.pk] = JobChannel(job)
+        track_local_job(job.pk)
+        asyncio.run_coroutine_threadsafe(self._run(job.pk), self.loop)
+    
+    def channel(self, job_id: int) -> JobChannel | None:
+        """Return the live channel of a supervised job, if any."""
+        return self._channels.get(job_id)
+    
+    async def _run(self, job_id: int) -> None:
+        channel = self._channels[job_id]
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_jobs)
+        
+        async with self._slots:
+            writes: set[asyncio.Task] = set()
+            last_write = 0.0
+            
+            async def save(**fields) -> None:
+                channel.update(**fields)
+                await AnalysisJob.objects.filter(pk=job_id).aupdate(
+                    updated_at=timezone.now(), **fields
+                )
+            
+            async def save_progress(**fields) -> None:
+                try:
+                    await AnalysisJob.objects.filter(pk=job_id).aupdate(
+                        updated_at=timezone.now(), **fields
+                    )
+                except DatabaseError:
+                    logger.warning("Could not save progress of job %s", job_id, exc_info=True)
+            
+            def progress(stage: str, current: int, total: int, metrics=None) -> None:
+                nonlocal last_write
+                fields = {"stage": stage, "current": current, "total": total}
+                if metrics is not None:
+                    fields["partial_metrics"] = metrics.to_dict()
+                channel.update(**fields)
+                
+                now = time.monotonic()
+                if now - last_write >= self.PERSIST_INTERVAL_S or current == total:
+                    last_write = now
+                    task = asyncio.create_task(save_progress(**fields))
+                    writes.add(task)
+                    task.add_done_callback(writes.discard)
+            
+            try:
+                await save(status=AnalysisJob.Status.RUNNING, started_at=timezone.now())
+                video = channel.job.video
+                
+                analyzer = LectureAnalyzer()
+                result = await analyzer.analyze_async(
+                    settings.MEDIA_ROOT / str(video.video),
+                    progress_callback=progress,
+                    content_hash=video.content_hash or None,
+                )
+                
+                lecture = await sync_to_async(save_lecture)(
+                    video.name.title(),
+                    result,
+                    content_hash=video.content_hash,
+                    config_key=analyzer.config_fingerprint,
+                )
+                await asyncio.gather(*writes)
+                await save(
+                    status=AnalysisJob.Status.COMPLETED,
+                    lecture=lecture,
+                    finished_at=timezone.now(),
+                )
+            except Exception as exc:
+                logger.exception("Analysis job %s failed", job_id)
+                await asyncio.gather(*writes, return_exceptions=True)
+                await save(
+                    status=AnalysisJob.Status.FAILED,
+                    error=str(exc) or exc.__class__.__name__,
+                    finished_at=timezone.now(),
+                )
+            finally:
+                self._channels.pop(job_id, None)
+                untrack_local_job(job_id)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+supervisor = AnalysisSupervisor(max_jobs=settings.ANALYSIS_ASYNC_MAX_JOBS)
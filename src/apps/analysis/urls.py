@@ -9,7 +9,9 @@ from . import views
 app_name = "analysis"
 
 urlpatterns = [
-    path("", views.analyze, name="analyze"),
-    path("loading/", views.loading, name="loading"),
+    path("<int:video_id>/", views.loading, name="loading"),
+    path("<int:video_id>/status/", views.status, name="status"),
+    path("<int:video_id>/events/", views.events, name="events"),
+    path("<int:video_id>/results/", views.results, name="results"),
+    path("assets/plotly.min.js", views.plotly_js, name="plotly_js"),
 ]
-
@@ -2,59 +2,199 @@
 Views for lecture analysis.
 """
 
-from pathlib import Path
+import asyncio
+import json
+from functools import lru_cache
 
-from django.conf import settings
-from django.shortcuts import render
+import plotly
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
+from plotly.offline import get_plotlyjs
 
 from apps.uploads.models import Video
-from apps.lectures.models import Lecture
-from core.services import LectureAnalyzer
+from core.services import instrumentation
 
+from .jobs import fail_interrupted_jobs, start_job
+from .models import AnalysisJob
+from .supervisor import supervisor
 
-def loading(request):
-    """Display loading page while analysis runs."""
-    return render(request, "analysis/loading.html")
 
+def loading(request, video_id: int):
+    """
+    Start (or resume watching) the analysis of a video.
+    
+    GET: Reuse the latest result, a cached result for identical content,
+         or start a background job and show the loading page.
+    POST: Force a fresh analysis when ``force`` is set.
+    
+    The loading page follows the event stream when served over ASGI, or
+    polls the status endpoint otherwise, and redirects to the results
+    when done.
+    """
+    video = get_object_or_404(Video, pk=video_id)
+    
+    if request.method == "POST":
+        start_job(video, force=request.POST.get("force") == "1")
+        return redirect("analysis:loading", video_id=video.pk)
+    
+    fail_interrupted_jobs(video.analysis_jobs.all())
+    job = video.analysis_jobs.first()
+    if not job or job.status == AnalysisJob.Status.FAILED:
+        job = start_job(video)
+    
+    if job.status == AnalysisJob.Status.COMPLETED:
+        return redirect("analysis:results", video_id=video.pk)
+    
+    return render(
+        request,
+        "analysis/loading.html",
+        {"video": video, "use_events": _can_stream(request)},
+    )
 
-def analyze(request):
+
+def status(request, video_id: int):
+    """Report the progress of the latest analysis job for a video as JSON."""
+    job = AnalysisJob.objects.filter(video_id=video_id).first()
+    if not job:
+        return JsonResponse({"error": "No analysis found"}, status=404)
+    
+    return JsonResponse(_with_results_url(job.to_status_dict(), video_id))
+
+
+async def events(request, video_id: int):
     """
-    Analyze the most recently uploaded lecture video.
+    Stream the progress of the latest analysis job as server-sent events.
     
-    Performs comprehensive analysis including:
-    - Speech emotion recognition
-    - Transcript generation
-    - Engagement metrics
-    - AI-generated feedback
+    Each event carries the same JSON as the status endpoint. Jobs run by
+    the async supervisor push every change as it happens; other jobs are
+    read from the database every ``EVENT_POLL_S`` seconds. The stream
+    ends once the job completes or fails.
+    
+    Only available over ASGI: a WSGI server buffers the whole stream
+    before sending it, so clients are told to poll ``status`` instead.
     """
-    latest_video = Video.objects.order_by("-id").first()
-    if not latest_video:
-        return render(request, "analysis/results.html", {"error": "No video found"})
+    if not _can_stream(request):
+        return JsonResponse(
+            {"error": "Event streams require an ASGI server; poll the status endpoint"},
+            status=501,
+        )
     
-    video_path = settings.MEDIA_ROOT / str(latest_video.video)
+    job = await AnalysisJob.objects.filter(video_id=video_id).afirst()
+    if not job:
+        return JsonResponse({"error": "No analysis found"}, status=404)
     
-    # Run analysis
-    analyzer = LectureAnalyzer()
-    result = analyzer.analyze(video_path)
+    response = StreamingHttpResponse(
+        _job_events(job, video_id), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+EVENT_POLL_S = 2.0
+
+FINISHED = (AnalysisJob.Status.COMPLETED, AnalysisJob.Status.FAILED)
+
+
+async def _job_events(job: AnalysisJob, video_id: int):
+    """Yield an SSE message per status change, with keep-alive comments."""
+    last = None
+    version = -1
     
-    # Get lecture name from session
-    lecture_name = request.session.get("lecture_name", "Lecture").title()
+    while True:
+        channel = supervisor.channel(job.pk)
+        if channel is not None:
+            version, data = await channel.wait(version, timeout=EVENT_POLL_S * 5)
+        else:
+            if last is not None:
+                await asyncio.sleep(EVENT_POLL_S)
+            await job.arefresh_from_db()
+            data = job.to_status_dict()
+        
+        if data != last:
+            last = data
+            yield f"data: {json.dumps(_with_results_url(data, video_id))}\n\n"
+        else:
+            yield ": keep-alive\n\n"
+        
+        if data["status"] in FINISHED:
+            return
+
+
+def _can_stream(request) -> bool:
+    """Whether responses to this request can be streamed incrementally."""
+    return isinstance(request, ASGIRequest)
+
+
+def _with_results_url(data: dict, video_id: int) -> dict:
+    if data["status"] == AnalysisJob.Status.COMPLETED:
+        data["results_url"] = reverse("analysis:results", args=[video_id])
+    return data
+
+
+def metrics(request):
+    """Expose the pipeline stage counters and latency histograms to Prometheus."""
+    return HttpResponse(
+        instrumentation.render_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def results(request, video_id: int):
+    """
+    Display the results of the latest completed analysis of a video.
     
-    # Save to database
-    lecture = Lecture.objects.create(
-        name=lecture_name,
-        engagement_ratio=result.metrics.engagement_percentage,
-        tone_modality=result.metrics.tone_modulation_score,
-        questions=result.metrics.question_count,
-        wpm=result.metrics.words_per_minute,
-        suggestion=result.feedback,
-        graph=result.timeline_chart_html,
+    Shows:
+    - Speech emotion recognition
+    - Transcript-based metrics
+    - Engagement timeline
+    - AI-generated feedback
+    """
+    job = (
+        AnalysisJob.objects
+        .filter(video_id=video_id, status=AnalysisJob.Status.COMPLETED)
+        .select_related("lecture")
+        .first()
     )
+    if not job or not job.lecture:
+        return render(request, "analysis/results.html", {"error": "No analysis found"})
     
-    # Build template context
-    context = result.to_context()
-    context["name"] = lecture_name
-    context["date"] = lecture.created_at.strftime("%Y-%m-%d")
+    lecture = job.lecture
+    context = {
+        "video_id": video_id,
+        "name": lecture.name,
+        "date": lecture.created_at.strftime("%Y-%m-%d"),
+        "questions": lecture.questions,
+        "engagement_score": lecture.engagement_ratio,
+        "tone_modulation": lecture.tone_modality,
+        "wpm": lecture.wpm,
+        "timeline": lecture.timeline,
+        "graph": lecture.graph,
+        "suggestion": lecture.suggestion,
+        "segment_count": lecture.segment_count,
+        "skipped_segments": lecture.skipped_segments,
+        "skipped_percentage": lecture.skipped_percentage,
+    }
     
     return render(request, "analysis/results.html", context)
 
+
+@lru_cache(maxsize=1)
+def _plotly_bundle() -> bytes:
+    return get_plotlyjs().encode()
+
+
+@cache_control(public=True, max_age=7 * 24 * 3600)
+@etag(lambda request: plotly.__version__)
+def plotly_js(request):
+    """
+    Serve the plotly.js bundle shipped with the plotly package.
+    
+    Every chart page references this one URL, so browsers download the
+    bundle once instead of receiving it inlined in each chart.
+    """
+    return HttpResponse(_plotly_bundle(), content_type="application/javascript")
@@ -4,7 +4,7 @@ Admin configuration for lectures app.
 
 from django.contrib import admin
 
-from .models import Lecture
+from .models import Lecture, Segment
 
 
 @admin.register(Lecture)
@@ -14,5 +14,13 @@ class LectureAdmin(admin.ModelAdmin):
     list_display = ("name", "created_at", "engagement_ratio", "tone_modality", "wpm")
     list_filter = ("created_at",)
     search_fields = ("name",)
-    readonly_fields = ("created_at", "graph")
+    readonly_fields = ("created_at", "graph", "timings")
 
+
+@admin.register(Segment)
+class SegmentAdmin(admin.ModelAdmin):
+    """Admin interface for Segment model."""
+    
+    list_display = ("lecture", "index", "start_ms", "is_speech", "dominant_emotion")
+    list_filter = ("is_speech", "dominant_emotion")
+    raw_id_fields = ("lecture",)
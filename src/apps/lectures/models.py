@@ -17,7 +17,14 @@ class Lecture(models.Model):
         questions: Number of questions asked.
         wpm: Words per minute speaking rate.
         suggestion: AI-generated improvement feedback.
-        graph: HTML for the engagement timeline visualization.
+        graph: HTML for the engagement timeline (analyses before timeline).
+        timeline: Run-length encoded engagement timeline data.
+        content_hash: SHA-256 of the analyzed video file.
+        config_key: Fingerprint of the analyzer configuration used.
+        segment_count: Number of audio segments in the lecture.
+        skipped_segments: Silent segments that skipped transcription and
+            emotion inference.
+        timings: Wall time, CPU time and bytes per pipeline stage.
     """
     
     name = models.CharField(
@@ -57,14 +64,172 @@ class Lecture(models.Model):
     graph = models.TextField(
         blank=True,
         null=True,
-        help_text="HTML for engagement timeline chart",
+        help_text="HTML for engagement timeline chart (legacy)",
+    )
+    timeline = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Engagement timeline runs, drawn client-side",
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="SHA-256 of the analyzed video file",
+    )
+    config_key = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Fingerprint of the analyzer configuration",
+    )
+    segment_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of audio segments analyzed",
+    )
+    skipped_segments = models.PositiveIntegerField(
+        default=0,
+        help_text="Silent segments skipped by voice activity detection",
+    )
+    timings = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Per-stage timing summary of the analysis",
     )
     
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Lecture Analysis"
         verbose_name_plural = "Lecture Analyses"
+        indexes = [
+            models.Index(fields=["content_hash", "config_key"]),
+            models.Index(fields=["-created_at", "-id"], name="lecture_history_idx"),
+        ]
+    
+    @property
+    def skipped_percentage(self) -> float:
+        """Share of segments whose transcription and inference were skipped."""
+        if not self.segment_count:
+            return 0.0
+        return round(self.skipped_segments / self.segment_count * 100, 1)
     
     def __str__(self) -> str:
         return f"{self.name} - {self.created_at.strftime('%Y-%m-%d')}"
 
+
+class SegmentQuerySet(models.QuerySet):
+    """Database-side aggregations over analyzed segments."""
+    
+    def speech(self) -> "SegmentQuerySet":
+        return self.filter(is_speech=True)
+    
+    def engagement_by_minute(self) -> "SegmentQuerySet":
+        """Engaging share of speech segments per minute of lecture, across lectures."""
+        return (
+            self.speech()
+            .values("start_minute")
+            .annotate(
+                engagement=models.Avg(
+                    models.Case(
+                        models.When(is_engaging=True, then=models.Value(100.0)),
+                        default=models.Value(0.0),
+                        output_field=models.FloatField(),
+                    )
+                ),
+                segments=models.Count("id"),
+            )
+            .order_by("start_minute")
+        )
+    
+    def emotion_distribution(self) -> "SegmentQuerySet":
+        """Number of speech segments per dominant emotion, most common first."""
+        return (
+            self.speech()
+            .values("dominant_emotion")
+            .annotate(segments=models.Count("id"))
+            .order_by("-segments")
+        )
+
+
+class Segment(models.Model):
+    """
+    One analyzed audio segment of a lecture.
+    
+    Attributes:
+        lecture: The analysis this segment belongs to.
+        index: Position of the segment in the lecture.
+        start_ms: Segment start within the lecture.
+        end_ms: Segment end within the lecture.
+        start_minute: Minute of lecture the segment starts in, for grouping.
+        transcript: Speech-to-text transcript.
+        word_count: Number of words in the transcript.
+        question_count: Number of question marks in the transcript.
+        is_speech: False for silent segments, which have no emotion.
+        is_engaging: Whether the dominant emotion counts as engaging.
+        dominant_emotion: Highest-scoring emotion label.
+        confidence: Score of the dominant emotion.
+        scores: Raw score per emotion label.
+    """
+    
+    lecture = models.ForeignKey(
+        Lecture,
+        on_delete=models.CASCADE,
+        related_name="segments",
+        help_text="The analysis this segment belongs to",
+    )
+    index = models.PositiveIntegerField(help_text="Position within the lecture")
+    start_ms = models.PositiveIntegerField(help_text="Start time in milliseconds")
+    end_ms = models.PositiveIntegerField(help_text="End time in milliseconds")
+    start_minute = models.PositiveIntegerField(help_text="Minute of lecture the segment starts in")
+    transcript = models.TextField(blank=True, default="")
+    word_count = models.PositiveIntegerField(default=0)
+    question_count = models.PositiveIntegerField(default=0)
+    is_speech = models.BooleanField(default=True)
+    is_engaging = models.BooleanField(default=False)
+    dominant_emotion = models.CharField(max_length=16, blank=True, default="")
+    confidence = models.FloatField(blank=True, null=True)
+    scores = models.JSONField(blank=True, null=True)
+    
+    objects = SegmentQuerySet.as_manager()
+    
+    # Rows per INSERT when storing a lecture's segments.
+    BATCH_SIZE = 500
+    
+    class Meta:
+        ordering = ["lecture", "index"]
+        constraints = [
+            models.UniqueConstraint(fields=["lecture", "index"], name="segment_lecture_index_unique"),
+        ]
+        indexes = [
+            models.Index(
+                fields=["is_speech", "start_minute", "is_engaging"],
+                name="segment_minute_engagement_idx",
+            ),
+            models.Index(
+                fields=["is_speech", "dominant_emotion", "lecture"],
+                name="segment_emotion_idx",
+            ),
+        ]
+    
+    def __str__(self) -> str:
+        return f"{self.lecture.name} #{self.index}"
+    
+    @classmethod
+    def from_utterance(cls, lecture: Lecture, index: int, utterance) -> "Segment":
+        """Build an unsaved segment from an analyzer Utterance."""
+        emotion = utterance.emotion
+        return cls(
+            lecture=lecture,
+            index=index,
+            start_ms=utterance.start_time_ms,
+            end_ms=utterance.end_time_ms,
+            start_minute=utterance.start_time_ms // 60000,
+            transcript=utterance.transcript,
+            word_count=utterance.word_count,
+            question_count=utterance.question_count,
+            is_speech=utterance.is_speech,
+            is_engaging=emotion.is_engaging if emotion else False,
+            dominant_emotion=emotion.dominant_emotion if emotion else "",
+            confidence=emotion.confidence if emotion else None,
+            scores=emotion.raw_scores if emotion else None,
+        )
@@ -10,5 +10,7 @@ app_name = "lectures"
 
 urlpatterns = [
     path("", views.history, name="history"),
+    path("<int:lecture_id>/", views.detail, name="detail"),
+    path("trends/", views.trends, name="trends"),
 ]
 
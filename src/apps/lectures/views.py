@@ -2,15 +2,152 @@
 Views for lecture history.
 """
 
-from django.shortcuts import render
+import math
+from datetime import datetime
 
-from .models import Lecture
+from django.db.models import Q
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404, render
+
+from core.services import UtteranceStore
+
+from .models import Lecture, Segment
+
+
+PAGE_SIZE = 25
 
 
 def history(request):
     """
-    Display lecture analysis history.
+    Display lecture analysis history, newest first, one page at a time.
+    
+    Pages are addressed by a keyset cursor on (created_at, id) rather than
+    an offset, so every page is a single index range scan. The list omits
+    the feedback and chart columns; the page fetches them per lecture from
+    the detail endpoint.
     """
-    lectures = Lecture.objects.all()
-    return render(request, "lectures/history.html", {"lectures": lectures})
+    lectures = (
+        Lecture.objects
+        .defer("suggestion", "graph", "timeline", "timings")
+        .order_by("-created_at", "-id")
+    )
+    
+    cursor = _parse_cursor(request.GET.get("cursor", ""))
+    if cursor:
+        created_at, lecture_id = cursor
+        lectures = lectures.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=lecture_id)
+        )
+    
+    page = list(lectures[:PAGE_SIZE + 1])
+    next_cursor = ""
+    if len(page) > PAGE_SIZE:
+        page = page[:PAGE_SIZE]
+        next_cursor = _format_cursor(page[-1])
+    
+    return render(request, "lectures/history.html", {
+        "lectures": page,
+        "next_cursor": next_cursor,
+        "is_first_page": cursor is None,
+    })
+
+
+def detail(request, lecture_id: int):
+    """
+    Return the full analysis of one lecture as JSON.
+    
+    Lectures with stored segments also include per-minute speaking rate,
+    rolling engagement and emotion transitions computed from them.
+    """
+    lecture = get_object_or_404(Lecture, pk=lecture_id)
+    return JsonResponse({
+        "id": lecture.pk,
+        "name": lecture.name,
+        "created_at": lecture.created_at.isoformat(),
+        "questions": float(lecture.questions),
+        "engagement_score": float(lecture.engagement_ratio),
+        "tone_modulation": float(lecture.tone_modality),
+        "wpm": float(lecture.wpm),
+        "suggestion": lecture.suggestion,
+        "timeline": lecture.timeline,
+        "graph": None if lecture.timeline else lecture.graph,
+        "timeline_metrics": _timeline_metrics(lecture),
+    })
+
+
+def trends(request):
+    """
+    Aggregate stored segments across lectures as JSON.
+    
+    Optional ``since`` and ``until`` ISO dates restrict the lectures to an
+    analysis period such as a term.
+    """
+    segments = Segment.objects.all()
+    try:
+        since = datetime.fromisoformat(request.GET["since"]) if "since" in request.GET else None
+        until = datetime.fromisoformat(request.GET["until"]) if "until" in request.GET else None
+    except ValueError:
+        return JsonResponse({"error": "Dates must be in ISO format"}, status=400)
+    
+    if since:
+        segments = segments.filter(lecture__created_at__gte=since)
+    if until:
+        segments = segments.filter(lecture__created_at__lt=until)
+    
+    return JsonResponse({
+        "engagement_by_minute": list(segments.engagement_by_minute()),
+        "emotion_distribution": list(segments.emotion_distribution()),
+    })
+
+
+def _timeline_metrics(lecture: Lecture) -> dict | None:
+    """Compute the timeline metrics of a lecture from its stored segments."""
+    rows = list(
+        lecture.segments
+        .order_by("index")
+        .values_list(
+            "start_ms",
+            "end_ms",
+            "word_count",
+            "question_count",
+            "is_speech",
+            "dominant_emotion",
+            "scores",
+        )
+    )
+    if not rows:
+        return None
+    
+    store = UtteranceStore.from_columns(*zip(*rows))
+    minutes, wpm = store.words_per_minute()
+    window_ends, engagement = store.rolling_engagement()
+    return {
+        "wpm_by_minute": [
+            {"minute": round(float(minute), 2), "wpm": round(float(rate), 1)}
+            for minute, rate in zip(minutes, wpm)
+        ],
+        "rolling_engagement": [
+            {
+                "minute": round(float(minute), 2),
+                "engagement": None if math.isnan(value) else round(float(value), 1),
+            }
+            for minute, value in zip(window_ends, engagement)
+        ],
+        "emotion_transitions": {
+            "labels": list(store.labels),
+            "counts": store.emotion_transitions().tolist(),
+        },
+    }
+
+
+def _format_cursor(lecture: Lecture) -> str:
+    return f"{lecture.created_at.isoformat()}_{lecture.pk}"
+
 
+def _parse_cursor(value: str) -> tuple[datetime, int] | None:
+    """Parse a ``<created_at>_<id>`` cursor, ignoring malformed values."""
+    created_at, _, lecture_id = value.rpartition("_")
+    try:
+        return datetime.fromisoformat(created_at), int(lecture_id)
+    except ValueError:
+        return None
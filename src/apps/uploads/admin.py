@@ -4,7 +4,7 @@ Admin configuration for uploads app.
 
 from django.contrib import admin
 
-from .models import Video
+from .models import UploadSession, Video
 
 
 @admin.register(Video)
@@ -16,3 +16,12 @@ class VideoAdmin(admin.ModelAdmin):
     search_fields = ("name",)
     readonly_fields = ("uploaded_at",)
 
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    """Admin interface for UploadSession model."""
+    
+    list_display = ("filename", "name", "received_bytes", "total_size", "container", "created_at")
+    list_filter = ("container", "created_at")
+    search_fields = ("name", "filename")
+    readonly_fields = ("created_at", "updated_at")
@@ -0,0 +1,286 @@
+"""
+Chunked, resumable uploads written straight to the final storage path.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from .models import UploadSession, Video
+
+
+BLOCK_SIZE = 1024 * 1024
+
+# Leading bytes identifying the containers we accept.
+CONTAINER_SIGNATURES = (
+    (4, b"ftyp", "mp4"),
+    (0, b"\x1a\x45\xdf\xa3", "matroska"),
+    (8, b"AVI ", "avi"),
+    (0, b"FLV", "flv"),
+    (0, b"\x00\x00\x01\xba", "mpeg-ps"),
+    (0, b"\x47", "mpeg-ts"),
+)
+
+# Bytes of an ``mvhd`` body up to and including the duration, by version.
+MVHD_BODY_SIZES = {0: 20, 1: 32}
+
+# Running SHA-256 per session, tagged with the offset it has consumed.
+# A session whose hasher is missing (e.g. after a restart) is rehashed
+# from the bytes already on disk.
+_hashers: dict[str, tuple[int, "hashlib._Hash"]] = {}
+_hashers_lock = threading.Lock()
+
+
+class UploadError(Exception):
+    """A chunk that cannot be accepted, with the HTTP status to report."""
+    
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def create_session(name: str, filename: str, total_size: int) -> UploadSession:
+    """Start an upload and reserve its file in media storage."""
+    if total_size <= 0:
+        raise UploadError("File size must be positive")
+    if total_size > settings.CHUNKED_UPLOAD_MAX_BYTES:
+        raise UploadError("File is too large", status=413)
+    
+    session = UploadSession(name=name, filename=filename, total_size=total_size)
+    session.storage_path = f"videos/{session.pk.hex}_{get_valid_filename(filename) or 'video'}"
+    
+    path = _absolute_path(session)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    
+    session.save()
+    return session
+
+
+def write_chunk(
+    session_id,
+    start: int,
+    total_size: int,
+    stream: BinaryIO,
+    length: int,
+) -> UploadSession:
+    """
+    Append the byte range starting at ``start`` to an upload.
+    
+    Ranges must arrive in order: a range that does not start at the number
+    of bytes already received raises UploadError with status 409, and the
+    client resumes from ``received_bytes``. The content hash and container
+    probe are advanced as the bytes are written. The last range completes
+    the session and creates its Video.
+    
+    The body is written without holding a database lock. The range is then
+    committed with an update conditional on ``received_bytes`` still being
+    ``start``, so of two concurrent requests for the same range only one
+    advances the upload.
+    """
+    session = UploadSession.objects.get(pk=session_id)
+    
+    if session.is_complete:
+        raise UploadError("Upload is already complete", status=409)
+    if total_size != session.total_size:
+        raise UploadError("Total size does not match the upload")
+    if start != session.received_bytes:
+        raise UploadError("Range does not continue the upload", status=409)
+    if start + length > session.total_size:
+        raise UploadError("Range exceeds the file size", status=416)
+    
+    # Work on a copy so a failed or losing request leaves the shared hasher intact.
+    hasher = _hasher_for(session).copy()
+    written = 0
+    with open(_absolute_path(session), "r+b") as f:
+        f.seek(start)
+        while written < length:
+            block = stream.read(min(BLOCK_SIZE, length - written))
+            if not block:
+                break
+            f.write(block)
+            hasher.update(block)
+            written += len(block)
+    
+    if written != length:
+        raise UploadError("Request body ended before the declared range")
+    
+    session.received_bytes += written
+    if start == 0:
+        session.container = sniff_container(_read(session, 0, 16))
+        if not session.container:
+            raise UploadError("Unsupported video format", status=415)
+    _advance_probe(session)
+    
+    with transaction.atomic():
+        updated = UploadSession.objects.filter(
+            pk=session.pk,
+            received_bytes=start,
+            video__isnull=True,
+        ).update(
+            received_bytes=session.received_bytes,
+            container=session.container,
+            duration_ms=session.duration_ms,
+            probe_offset=session.probe_offset,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            raise UploadError("Range does not continue the upload", status=409)
+        
+        if session.received_bytes == session.total_size:
+            _complete(session, hasher.hexdigest())
+    
+    if session.is_complete:
+        _forget_hasher(session)
+    else:
+        with _hashers_lock:
+            _hashers[str(session.pk)] = (session.received_bytes, hasher)
+    return session
+
+
+def sniff_container(header: bytes) -> str:
+    """Identify the container format from the first bytes of a file."""
+    for offset, signature, container in CONTAINER_SIGNATURES:
+        if header[offset:offset + len(signature)] == signature:
+            return container
+    return ""
+
+
+def _advance_probe(session: UploadSession) -> None:
+    """
+    Walk the top-level MP4 boxes that have arrived so far.
+    
+    When the ``moov`` box's ``mvhd`` child has arrived, the duration is
+    read from it and probing stops (``probe_offset`` = -1).
+    """
+    if session.container != "mp4":
+        session.probe_offset = -1
+    
+    while session.probe_offset >= 0:
+        header = _box_header(session, session.probe_offset)
+        if header is None:
+            return
+        size, box_type, header_size = header
+        if size < header_size:
+            session.probe_offset = -1
+            return
+        
+        if box_type == b"moov":
+            moov_end = session.probe_offset + size
+            if _probe_moov(session, session.probe_offset + header_size, moov_end):
+                session.probe_offset = -1
+            return
+        
+        session.probe_offset += size
+
+
+def _probe_moov(session: UploadSession, offset: int, end: int) -> bool:
+    """
+    Find ``mvhd`` among the children of ``moov`` and read the duration.
+    
+    Returns False if the box has not fully arrived yet, True once probing
+    is finished, whether or not a duration was found.
+    """
+    while offset < end:
+        header = _box_header(session, offset)
+        if header is None:
+            return False
+        size, box_type, header_size = header
+        if size < header_size:
+            return True
+        
+        if box_type == b"mvhd":
+            body = offset + header_size
+            if body + 1 > session.received_bytes:
+                return False
+            needed = MVHD_BODY_SIZES.get(_read(session, body, 1)[0])
+            if needed is None or header_size + needed > size:
+                return True
+            if body + needed > session.received_bytes:
+                return False
+            session.duration_ms = _mvhd_duration_ms(_read(session, body, needed))
+            return True
+        
+        offset += size
+    return True
+
+
+def _box_header(session: UploadSession, offset: int) -> tuple[int, bytes, int] | None:
+    """Return the size, type and header size of a box, or None if not yet received."""
+    if offset + 8 > session.received_bytes:
+        return None
+    size, box_type = struct.unpack(">I4s", _read(session, offset, 8))
+    if size == 1:
+        if offset + 16 > session.received_bytes:
+            return None
+        return struct.unpack(">Q", _read(session, offset + 8, 8))[0], box_type, 16
+    if size == 0:
+        # The box extends to the end of the file.
+        size = session.total_size - offset
+    return size, box_type, 8
+
+
+def _mvhd_duration_ms(body: bytes) -> int | None:
+    """Parse the duration from the body of an ``mvhd`` box."""
+    if not body or len(body) < MVHD_BODY_SIZES.get(body[0], len(body) + 1):
+        return None
+    if body[0] == 1:
+        timescale, duration = struct.unpack(">IQ", body[20:32])
+    else:
+        timescale, duration = struct.unpack(">II", body[12:20])
+    return duration * 1000 // timescale if timescale else None
+
+
+def _complete(session: UploadSession, content_hash: str) -> None:
+    session.content_hash = content_hash
+    session.video = Video.objects.create(
+        name=session.name,
+        video=session.storage_path,
+        content_hash=content_hash,
+    )
+    UploadSession.objects.filter(pk=session.pk).update(
+        content_hash=content_hash,
+        video=session.video,
+    )
+
+
+def _hasher_for(session: UploadSession):
+    with _hashers_lock:
+        offset, hasher = _hashers.get(str(session.pk), (-1, None))
+    if hasher is not None and offset == session.received_bytes:
+        return hasher
+    
+    hasher = hashlib.sha256()
+    remaining = session.received_bytes
+    with open(_absolute_path(session), "rb") as f:
+        while remaining:
+            block = f.read(min(BLOCK_SIZE, remaining))
+            if not block:
+                break
+            hasher.update(block)
+            remaining -= len(block)
+    return hasher
+
+
+def _forget_hasher(session: UploadSession) -> None:
+    with _hashers_lock:
+        _hashers.pop(str(session.pk), None)
+
+
+def _read(session: UploadSession, offset: int, size: int) -> bytes:
+    with open(_absolute_path(session), "rb") as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+def _absolute_path(session: UploadSession) -> Path:
+    return Path(settings.MEDIA_ROOT) / session.storage_path
@@ -0,0 +1,32 @@
+"""
+Upload handlers for video upload functionality.
+"""
+
+import hashlib
+
+from django.core.files.uploadhandler import FileUploadHandler
+
+
+class ContentHashUploadHandler(FileUploadHandler):
+    """
+    Computes a SHA-256 digest of each uploaded file while it streams in.
+    
+    The handler passes every chunk through unchanged to the next handler,
+    so the file is hashed during the transfer instead of being read back
+    from disk afterwards. Digests are stored on
+    ``request.upload_content_hashes``, keyed by form field name.
+    """
+    
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        self._hasher = hashlib.sha256()
+    
+    def receive_data_chunk(self, raw_data, start):
+        self._hasher.update(raw_data)
+        return raw_data
+    
+    def file_complete(self, file_size):
+        hashes = getattr(self.request, "upload_content_hashes", {})
+        hashes[self.field_name] = self._hasher.hexdigest()
+        self.request.upload_content_hashes = hashes
+        return None
@@ -2,6 +2,8 @@
 Models for video upload functionality.
 """
 
+import uuid
+
 from django.db import models
 
 
@@ -13,6 +15,7 @@ class Video(models.Model):
         name: Title/topic of the lecture.
         video: The uploaded video file.
         uploaded_at: Timestamp of upload.
+        content_hash: SHA-256 of the file contents, computed during upload.
     """
     
     name = models.CharField(
@@ -28,6 +31,13 @@ class Video(models.Model):
         auto_now_add=True,
         help_text="When the video was uploaded",
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        db_index=True,
+        help_text="SHA-256 of the uploaded file",
+    )
     
     class Meta:
         ordering = ["-uploaded_at"]
@@ -37,3 +47,63 @@ class Video(models.Model):
     def __str__(self) -> str:
         return f"{self.name} ({self.uploaded_at.strftime('%Y-%m-%d')})"
 
+
+class UploadSession(models.Model):
+    """
+    A chunked upload in progress, written directly to its final path.
+    
+    Attributes:
+        id: Random identifier used in the upload URL.
+        name: Title/topic of the lecture.
+        filename: Original name of the uploaded file.
+        storage_path: Path of the file relative to MEDIA_ROOT.
+        total_size: Declared size of the file in bytes.
+        received_bytes: Bytes written so far; the next range starts here.
+        container: Container format sniffed from the first bytes.
+        duration_ms: Duration probed from the container header, if known.
+        probe_offset: Offset of the next MP4 box to inspect, -1 when done.
+        content_hash: SHA-256 of the file, set when the upload completes.
+        video: The Video created from the finished upload.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=256, default="Untitled Lecture")
+    filename = models.CharField(max_length=255)
+    storage_path = models.CharField(max_length=512)
+    total_size = models.BigIntegerField()
+    received_bytes = models.BigIntegerField(default=0)
+    container = models.CharField(max_length=16, blank=True, default="")
+    duration_ms = models.BigIntegerField(null=True, blank=True)
+    probe_offset = models.BigIntegerField(default=0)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    video = models.OneToOneField(
+        Video,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="upload_session",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ["-created_at"]
+    
+    def __str__(self) -> str:
+        return f"{self.filename} ({self.received_bytes}/{self.total_size} bytes)"
+    
+    @property
+    def is_complete(self) -> bool:
+        return self.video_id is not None
+    
+    def to_status_dict(self) -> dict:
+        """Serialize the upload progress for the session endpoint."""
+        return {
+            "id": str(self.pk),
+            "received": self.received_bytes,
+            "total": self.total_size,
+            "complete": self.is_complete,
+            "container": self.container,
+            "duration_ms": self.duration_ms,
+            "video_id": self.video_id,
+        }
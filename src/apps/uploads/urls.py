@@ -10,6 +10,8 @@ app_name = "uploads"
 
 urlpatterns = [
     path("", views.upload, name="upload"),
-    path("preview/", views.preview, name="preview"),
+    path("preview/<int:video_id>/", views.preview, name="preview"),
+    path("upload/sessions/", views.create_upload_session, name="create_upload_session"),
+    path("upload/sessions/<uuid:session_id>/", views.upload_session, name="upload_session"),
 ]
 
@@ -2,10 +2,19 @@
 Views for video upload functionality.
 """
 
-from django.shortcuts import redirect, render
+import re
 
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
+from django.views.decorators.http import require_http_methods, require_POST
+
+from . import chunked
 from .forms import VideoUploadForm
-from .models import Video
+from .models import UploadSession, Video
+
+
+CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
 
 
 def upload(request):
@@ -18,28 +27,96 @@ def upload(request):
     if request.method == "POST":
         form = VideoUploadForm(data=request.POST, files=request.FILES)
         if form.is_valid():
-            video = form.save()
+            video = form.save(commit=False)
+            video.content_hash = getattr(request, "upload_content_hashes", {}).get("video", "")
+            video.save()
             request.session["lecture_name"] = video.name
-            return redirect("uploads:preview")
+            return redirect("uploads:preview", video_id=video.pk)
     else:
         form = VideoUploadForm()
     
     return render(request, "uploads/upload.html", {"form": form})
 
 
-def preview(request):
+def preview(request, video_id: int):
     """
     Display uploaded video preview before analysis.
     """
-    latest_video = Video.objects.order_by("-id").first()
-    
-    if not latest_video:
-        return redirect("uploads:upload")
+    video = get_object_or_404(Video, pk=video_id)
     
     context = {
-        "video_url": latest_video.video.url,
-        "video_name": latest_video.name,
+        "video_id": video.pk,
+        "video_url": video.video.url,
+        "video_name": video.name,
     }
     
     return render(request, "uploads/preview.html", context)
 
+
+@require_POST
+def create_upload_session(request):
+    """
+    Start a chunked upload.
+    
+    Expects ``name``, ``filename`` and ``size`` form fields and returns the
+    URL to PUT byte ranges to.
+    """
+    try:
+        size = int(request.POST.get("size", ""))
+    except ValueError:
+        return JsonResponse({"error": "size must be an integer"}, status=400)
+    
+    try:
+        session = chunked.create_session(
+            name=request.POST.get("name", "").strip()[:256] or "Untitled Lecture",
+            filename=request.POST.get("filename", "video"),
+            total_size=size,
+        )
+    except chunked.UploadError as e:
+        return JsonResponse({"error": str(e)}, status=e.status)
+    
+    data = session.to_status_dict()
+    data["upload_url"] = reverse("uploads:upload_session", args=[session.pk])
+    return JsonResponse(data, status=201)
+
+
+@require_http_methods(["GET", "PUT"])
+def upload_session(request, session_id):
+    """
+    Receive one byte range of a chunked upload, or report its progress.
+    
+    GET: Return the number of bytes received, so an interrupted client
+         knows where to resume.
+    PUT: Write the request body at the offset given by its
+         ``Content-Range: bytes <start>-<end>/<total>`` header. The final
+         range creates the Video and returns its preview URL.
+    """
+    session = get_object_or_404(UploadSession, pk=session_id)
+    
+    if request.method == "PUT":
+        match = CONTENT_RANGE.match(request.headers.get("Content-Range", ""))
+        if not match:
+            return JsonResponse({"error": "Missing or invalid Content-Range"}, status=400)
+        start, end, total = (int(value) for value in match.groups())
+        if end < start:
+            return JsonResponse({"error": "Invalid Content-Range"}, status=400)
+        
+        try:
+            session = chunked.write_chunk(
+                session.pk,
+                start=start,
+                total_size=total,
+                stream=request,
+                length=end - start + 1,
+            )
+        except chunked.UploadError as e:
+            session.refresh_from_db()
+            data = session.to_status_dict()
+            data["error"] = str(e)
+            return JsonResponse(data, status=e.status)
+    
+    data = session.to_status_dict()
+    if session.is_complete:
+        request.session["lecture_name"] = session.name
+        data["preview_url"] = reverse("uploads:preview", args=[session.video_id])
+    return JsonResponse(data)
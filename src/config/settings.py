@@ -120,6 +120,17 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR.parent / "data" / "media"
 
 
+# Hash uploads while they stream in, then store them as usual.
+FILE_UPLOAD_HANDLERS = [
+    "apps.uploads.handlers.ContentHashUploadHandler",
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
+# Largest file accepted by the chunked upload API, in bytes.
+CHUNKED_UPLOAD_MAX_BYTES = int(os.environ.get("EDUVISOR_CHUNKED_UPLOAD_MAX_BYTES", 8 * 1024**3))
+
+
 # =============================================================================
 # Default Primary Key
 # =============================================================================
@@ -127,6 +138,34 @@ MEDIA_ROOT = BASE_DIR.parent / "data" / "media"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
+# =============================================================================
+# Analysis Settings
+# =============================================================================
+
+# Load the emotion model and API clients when the app starts instead of on
+# the first analysis request.
+PRELOAD_MODELS = os.environ.get("EDUVISOR_PRELOAD_MODELS", "False").lower() == "true"
+
+# Number of analyses that may run concurrently in background worker threads.
+ANALYSIS_WORKERS = int(os.environ.get("EDUVISOR_ANALYSIS_WORKERS", "2"))
+
+# Run analyses as asyncio tasks on one supervisor event loop instead of on
+# worker threads. Network calls are awaited, so many analyses can run at
+# once; at most ANALYSIS_ASYNC_MAX_JOBS are active at a time.
+ANALYSIS_ASYNC = os.environ.get("EDUVISOR_ANALYSIS_ASYNC", "False").lower() == "true"
+ANALYSIS_ASYNC_MAX_JOBS = int(os.environ.get("EDUVISOR_ANALYSIS_ASYNC_MAX_JOBS", "16"))
+
+# Each process refreshes the heartbeat of the jobs it runs every
+# ANALYSIS_HEARTBEAT_S seconds. An active job whose heartbeat is older than
+# ANALYSIS_STALE_AFTER_S belonged to a process that died and is failed.
+ANALYSIS_HEARTBEAT_S = int(os.environ.get("EDUVISOR_ANALYSIS_HEARTBEAT_S", "30"))
+ANALYSIS_STALE_AFTER_S = int(os.environ.get("EDUVISOR_ANALYSIS_STALE_AFTER_S", "300"))
+
+# Extract the audio of each new upload in the background, so the analysis
+# can start from the prepared audio instead of decoding the video.
+PREPARE_AUDIO_ON_UPLOAD = os.environ.get("EDUVISOR_PREPARE_AUDIO_ON_UPLOAD", "True").lower() == "true"
+
+
 # =============================================================================
 # Project Directories
 # =============================================================================
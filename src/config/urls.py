@@ -5,6 +5,7 @@ Routes:
     /           - Video upload
     /analysis/  - Lecture analysis
     /lectures/  - Lecture history
+    /metrics    - Pipeline timing metrics (Prometheus text format)
     /admin/     - Django admin
 """
 
@@ -13,11 +14,14 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from apps.analysis.views import metrics
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("apps.uploads.urls")),
     path("analysis/", include("apps.analysis.urls")),
     path("lectures/", include("apps.lectures.urls")),
+    path("metrics", metrics, name="metrics"),
 ]
 
 if settings.DEBUG:
@@ -3,12 +3,22 @@ Service modules for lecture analysis.
 """
 
 from .audio import AudioProcessor, AudioChunk
-from .speech import SpeechTranscriber
+from .speech import SpeechPayload, SpeechTranscriber, prepare_payload
+from .speech_client import TokenBucket, TranscriptionClient
+from .features import AudioFeatures, decode_chunk
 from .emotion import EmotionAnalyzer, EmotionResult
-from .metrics import MetricsCalculator, LectureMetrics, Utterance
+from .emotion_backends import EmotionBackend, create_backend
+from .metrics import IncrementalMetrics, MetricsCalculator, LectureMetrics, Utterance
+from .utterance_store import UtteranceStore
 from .visualization import ChartGenerator
 from .ai_feedback import FeedbackGenerator
 from .config import Config
+from .segmentation import PauseSegmenter
+from .vad import VoiceActivity, VoiceActivityDetector
+from .workspace import AnalysisWorkspace
+from .registry import ModelRegistry, model_registry
+from .cache import ArtifactCache, hash_file
+from .instrumentation import Instrumentation, Timings, instrumentation, timed
 from .analyzer import LectureAnalyzer, AnalysisResult
 
 __all__ = [
@@ -19,13 +29,35 @@ __all__ = [
     "AudioProcessor",
     "AudioChunk",
     "SpeechTranscriber",
+    "SpeechPayload",
+    "prepare_payload",
+    "TranscriptionClient",
+    "TokenBucket",
+    "AudioFeatures",
+    "decode_chunk",
     "EmotionAnalyzer",
     "EmotionResult",
+    "EmotionBackend",
+    "create_backend",
     "MetricsCalculator",
+    "IncrementalMetrics",
     "LectureMetrics",
     "Utterance",
+    "UtteranceStore",
     "ChartGenerator",
     "FeedbackGenerator",
     "Config",
+    "PauseSegmenter",
+    "VoiceActivityDetector",
+    "VoiceActivity",
+    "AnalysisWorkspace",
+    "ModelRegistry",
+    "model_registry",
+    "ArtifactCache",
+    "hash_file",
+    "Instrumentation",
+    "Timings",
+    "instrumentation",
+    "timed",
 ]
 
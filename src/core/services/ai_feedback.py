@@ -4,22 +4,68 @@ AI-powered feedback generation service using OpenAI GPT.
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
 import openai
+from cachetools import TTLCache
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_delay,
+    wait_random_exponential,
+)
 
 from .config import Config
+from .instrumentation import timed
 from .metrics import LectureMetrics
 
 
+logger = logging.getLogger(__name__)
+
+# Transient API failures worth another attempt within the latency budget.
+RETRYABLE_ERRORS = (
+    openai.error.RateLimitError,
+    openai.error.APIConnectionError,
+    openai.error.ServiceUnavailableError,
+    openai.error.Timeout,
+)
+
+# Requests run here so a caller can stop waiting when the budget runs out.
+_request_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="feedback")
+
+
 class FeedbackGenerator:
     """
     Generates personalized teaching improvement suggestions using GPT.
+    
+    Metrics are rounded into buckets before they are put in the prompt, so
+    similar lectures produce the same prompt and share a cached response.
+    The cache is bounded in size (least recently used entries are dropped)
+    and in age. Each request must finish within ``feedback_timeout_s``;
+    otherwise, or if the API fails, a rule-based suggestion built from the
+    same metrics is returned and not cached.
     """
     
-    SYSTEM_PROMPT = """You are an expert educational coach helping teachers improve their lecturing skills. 
-Provide constructive, actionable feedback based on lecture analytics. 
+    MODEL = "gpt-3.5-turbo"
+    
+    # Bump when a prompt changes so cached responses are not reused.
+    PROMPT_VERSION = "1"
+    
+    # Bucket widths used to round each metric before prompting.
+    ENGAGEMENT_STEP = 5
+    TONE_STEP = 5
+    WPM_STEP = 10
+    
+    SYSTEM_PROMPT = """You are an expert educational coach helping teachers improve their lecturing skills.
+Provide constructive, actionable feedback based on lecture analytics.
 Be encouraging but specific. Address the teacher directly using "you/your"."""
 
-    USER_PROMPT_TEMPLATE = """Based on the following lecture analysis, provide personalized suggestions 
+    USER_PROMPT_TEMPLATE = """Based on the following lecture analysis, provide personalized suggestions
 to help improve teaching effectiveness. Keep your response concise (around 200 words).
 
 Lecture Analysis:
@@ -29,32 +75,183 @@ Lecture Analysis:
 - Engagement Score: {engagement}% of lecture was engaging
 
 Please provide specific, actionable suggestions for improvement."""
-    
+
     def __init__(self, config: Config | None = None) -> None:
         self.config = config or Config.load()
+        self._cache: TTLCache = TTLCache(
+            maxsize=self.config.feedback_cache_size,
+            ttl=self.config.feedback_cache_ttl_s,
+        )
+        self._lock = threading.Lock()
     
     def generate(self, metrics: LectureMetrics) -> str:
         """Generate personalized feedback based on lecture metrics."""
-        openai.api_key = self.config.openai_api_key
+        buckets = self.bucket_metrics(metrics)
+        cached = self._cached(buckets)
+        if cached is not None:
+            return cached
         
-        user_prompt = self.USER_PROMPT_TEMPLATE.format(
-            tone_modulation=metrics.tone_modulation_score,
-            wpm=metrics.words_per_minute,
-            questions=metrics.question_count,
-            engagement=metrics.engagement_percentage,
-        )
+        user_prompt = self.USER_PROMPT_TEMPLATE.format(**buckets)
+        deadline = time.monotonic() + self.config.feedback_timeout_s
+        future = _request_executor.submit(self._request, user_prompt, deadline)
         
-        messages = [
-            {"role": "system", "content": self.SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ]
+        try:
+            with timed("feedback", nbytes=len(user_prompt)):
+                feedback = future.result(timeout=self.config.feedback_timeout_s)
+        except FutureTimeout:
+            # Drop the request if it is still queued behind other calls.
+            future.cancel()
+            return self._timed_out(metrics)
+        except openai.error.OpenAIError as e:
+            return self._failed(metrics, e)
         
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=messages,
-            max_tokens=500,
-            temperature=0.7,
+        self._store(buckets, feedback)
+        return feedback
+    
+    async def generate_async(self, metrics: LectureMetrics) -> str:
+        """Like ``generate``, awaiting the API without blocking the event loop."""
+        buckets = self.bucket_metrics(metrics)
+        cached = self._cached(buckets)
+        if cached is not None:
+            return cached
+        
+        user_prompt = self.USER_PROMPT_TEMPLATE.format(**buckets)
+        deadline = time.monotonic() + self.config.feedback_timeout_s
+        
+        try:
+            with timed("feedback", nbytes=len(user_prompt), cpu=False):
+                feedback = await asyncio.wait_for(
+                    self._request_async(user_prompt, deadline),
+                    timeout=self.config.feedback_timeout_s,
+                )
+        except asyncio.TimeoutError:
+            return self._timed_out(metrics)
+        except openai.error.OpenAIError as e:
+            return self._failed(metrics, e)
+        
+        self._store(buckets, feedback)
+        return feedback
+    
+    def bucket_metrics(self, metrics: LectureMetrics) -> dict:
+        """Round metrics to the buckets used for prompting and caching."""
+        return {
+            "tone_modulation": _bucket(metrics.tone_modulation_score, self.TONE_STEP),
+            "wpm": _bucket(metrics.words_per_minute, self.WPM_STEP),
+            "questions": int(metrics.question_count),
+            "engagement": _bucket(metrics.engagement_percentage, self.ENGAGEMENT_STEP),
+        }
+    
+    def fallback(self, metrics: LectureMetrics) -> str:
+        """Build rule-based suggestions from the metrics without calling the API."""
+        suggestions = []
+        
+        if metrics.words_per_minute > 160:
+            suggestions.append(
+                f"Your pace of {metrics.words_per_minute:.0f} words per minute is fast. "
+                "Pause after key points so students can take notes and absorb them."
+            )
+        elif 0 < metrics.words_per_minute < 110:
+            suggestions.append(
+                f"Your pace of {metrics.words_per_minute:.0f} words per minute is slow. "
+                "Tightening explanations will help keep students' attention."
+            )
+        
+        if metrics.question_count < 3:
+            suggestions.append(
+                "You asked few questions. Check understanding regularly by asking "
+                "the class a question every few minutes."
+            )
+        
+        if metrics.engagement_percentage < 50:
+            suggestions.append(
+                f"Only {metrics.engagement_percentage:.0f}% of your lecture came across as "
+                "engaging. Bring in examples, stories or short activities to raise energy."
+            )
+        
+        if metrics.tone_modulation_score < 40:
+            suggestions.append(
+                "Your delivery had little vocal variety. Vary your pitch and emphasis "
+                "to highlight important ideas."
+            )
+        
+        if not suggestions:
+            suggestions.append(
+                "Your pace, questioning, engagement and vocal variety are all in a "
+                "good range. Keep building on what is working."
+            )
+        
+        return "\n\n".join(suggestions)
+    
+    def _cached(self, buckets: dict) -> str | None:
+        with self._lock:
+            return self._cache.get(self._cache_key(buckets))
+    
+    def _store(self, buckets: dict, feedback: str) -> None:
+        with self._lock:
+            self._cache[self._cache_key(buckets)] = feedback
+    
+    def _cache_key(self, buckets: dict) -> tuple:
+        return (self.PROMPT_VERSION, self.MODEL, *sorted(buckets.items()))
+    
+    def _timed_out(self, metrics: LectureMetrics) -> str:
+        logger.warning(
+            "Feedback request exceeded %.0fs; using local suggestions",
+            self.config.feedback_timeout_s,
         )
+        return self.fallback(metrics)
+    
+    def _failed(self, metrics: LectureMetrics, error: Exception) -> str:
+        logger.warning("Feedback request failed (%s); using local suggestions", error)
+        return self.fallback(metrics)
+    
+    def _request(self, user_prompt: str, deadline: float) -> str:
+        """
+        Call the API, retrying transient errors until the deadline.
         
-        return response["choices"][0]["message"]["content"]
+        The deadline is set when the caller starts waiting, so a worker is
+        released at about the time the caller falls back, retries included.
+        """
+        if time.monotonic() >= deadline:
+            raise openai.error.Timeout("Feedback deadline passed before the request started")
+        for attempt in Retrying(**self._retry_policy(deadline)):
+            with attempt:
+                response = openai.ChatCompletion.create(
+                    **self._request_kwargs(user_prompt, deadline)
+                )
+                return response["choices"][0]["message"]["content"]
+    
+    async def _request_async(self, user_prompt: str, deadline: float) -> str:
+        async for attempt in AsyncRetrying(**self._retry_policy(deadline)):
+            with attempt:
+                response = await openai.ChatCompletion.acreate(
+                    **self._request_kwargs(user_prompt, deadline)
+                )
+                return response["choices"][0]["message"]["content"]
+    
+    def _retry_policy(self, deadline: float) -> dict:
+        backoff = wait_random_exponential(multiplier=0.5, max=5)
+        return {
+            "retry": retry_if_exception_type(RETRYABLE_ERRORS),
+            # Never sleep past the deadline, and stop once it has passed.
+            "wait": lambda state: min(backoff(state), max(deadline - time.monotonic(), 0.0)),
+            "stop": stop_after_delay(max(deadline - time.monotonic(), 0.0)),
+            "reraise": True,
+        }
+    
+    def _request_kwargs(self, user_prompt: str, deadline: float) -> dict:
+        return {
+            "model": self.MODEL,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            "max_tokens": 500,
+            "temperature": 0.7,
+            "api_key": self.config.openai_api_key,
+            "request_timeout": max(deadline - time.monotonic(), 1.0),
+        }
+
 
+def _bucket(value: float, step: int) -> int:
+    """Round a value to the nearest multiple of ``step``."""
+    return int(round(value / step) * step)
@@ -4,17 +4,45 @@ Main lecture analysis orchestrator service.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import json
+import threading
+from collections import deque
+from contextlib import closing
+from contextvars import copy_context
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, TypeVar
 
-from .audio import AudioProcessor
+from .audio import AudioChunk, AudioProcessor
+from .cache import ArtifactCache, hash_file
 from .config import Config
-from .emotion import EmotionAnalyzer
-from .metrics import LectureMetrics, MetricsCalculator, Utterance
+from .emotion import EmotionAnalyzer, EmotionResult
+from .features import AudioFeatures, decode_chunk
+from .instrumentation import collect, timed
+from .metrics import IncrementalMetrics, LectureMetrics, MetricsCalculator, Utterance
 from .speech import SpeechTranscriber
+from .utterance_store import UtteranceStore
+from .vad import VoiceActivityDetector
 from .visualization import ChartGenerator
 from .ai_feedback import FeedbackGenerator
+from .registry import model_registry
+from .segmentation import PauseSegmenter
+from .workspace import AnalysisWorkspace
+
+
+T = TypeVar("T")
+
+# Audio extractions in progress, by audio cache key. Analyses of the same
+# content wait for these instead of decoding the video a second time.
+_extractions: dict[str, threading.Event] = {}
+_extractions_lock = threading.Lock()
+
+# Emotion inference of async analyses runs here, one batch at a time, so
+# many concurrent analyses do not oversubscribe the CPU.
+_inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
 
 
 @dataclass
@@ -23,8 +51,9 @@ class AnalysisResult:
     
     metrics: LectureMetrics
     feedback: str
-    timeline_chart_html: str
+    timeline: dict
     utterances: list[Utterance]
+    timings: dict = field(default_factory=dict)
     
     def to_context(self) -> dict:
         """Convert to template rendering context."""
@@ -33,8 +62,10 @@ class AnalysisResult:
             "engagement_score": self.metrics.engagement_percentage,
             "tone_modulation": self.metrics.tone_modulation_score,
             "wpm": self.metrics.words_per_minute,
-            "graph": self.timeline_chart_html,
+            "timeline": self.timeline,
             "suggestion": self.feedback,
+            "segment_count": self.metrics.utterance_count,
+            "skipped_segments": self.metrics.silent_count,
         }
 
 
@@ -42,6 +73,10 @@ class LectureAnalyzer:
     """
     Main orchestrator for lecture video analysis.
     
+    When no explicit config is given, the speech, emotion and feedback
+    services are shared process-wide through the model registry, so
+    creating an analyzer per request does not reload any models.
+    
     Example:
         analyzer = LectureAnalyzer()
         result = analyzer.analyze(Path("lecture.mp4"))
@@ -53,62 +88,577 @@ class LectureAnalyzer:
         config: Config | None = None,
         chunk_duration_ms: int = 30000,
     ) -> None:
+        shared = config is None
         self.config = config or Config.load()
         self.chunk_duration_ms = chunk_duration_ms
         
-        self._audio_processor = AudioProcessor(chunk_duration_ms=chunk_duration_ms)
-        self._speech_transcriber = SpeechTranscriber(config=self.config)
-        self._emotion_analyzer = EmotionAnalyzer()
+        self._speech_transcriber = self._service(
+            "speech", shared, lambda: SpeechTranscriber(config=self.config)
+        )
+        self._emotion_analyzer = self._service(
+            "emotion", shared, lambda: EmotionAnalyzer(
+                batch_size=self.config.emotion_batch_size,
+                num_threads=self.config.torch_num_threads,
+                backend=self.config.emotion_backend,
+            )
+        )
+        self._artifact_cache = self._service(
+            "artifact_cache", shared, lambda: ArtifactCache(
+                max_bytes=self.config.cache_max_bytes,
+            )
+        )
+        self._voice_detector = (
+            VoiceActivityDetector(
+                energy_threshold_db=self.config.vad_energy_threshold_db,
+                min_speech_ratio=self.config.vad_min_speech_ratio,
+            )
+            if self.config.vad_enabled else None
+        )
         self._metrics_calculator = MetricsCalculator()
         self._chart_generator = ChartGenerator()
-        self._feedback_generator = FeedbackGenerator(config=self.config)
+        self._feedback_generator = self._service(
+            "feedback", shared, lambda: FeedbackGenerator(config=self.config)
+        )
+    
+    @staticmethod
+    def _service(name: str, shared: bool, factory: Callable[[], T]) -> T:
+        """Return the process-wide service instance, or a private one."""
+        if not shared:
+            return factory()
+        return model_registry.get(f"service:{name}", factory)
+    
+    @property
+    def config_fingerprint(self) -> str:
+        """
+        Hash of every setting that affects analysis output.
+        
+        Two analyses of the same file with the same fingerprint produce
+        the same result, so it can be used as part of a cache key.
+        """
+        fields = {
+            "chunk_duration_ms": self.chunk_duration_ms,
+            "segmenter_version": PauseSegmenter.VERSION,
+            "audio_sample_rate": self.config.audio_sample_rate,
+            "audio_channels": self.config.audio_channels,
+            "speech_sample_rate": self.config.speech_sample_rate,
+            "speech_encoding": self.config.speech_encoding,
+            "speech_version": SpeechTranscriber.VERSION,
+            "emotion_model": EmotionAnalyzer.MODEL_ID,
+            "emotion_version": EmotionAnalyzer.VERSION,
+            "emotion_backend": self.config.emotion_backend,
+            "feedback_model": FeedbackGenerator.MODEL,
+            "feedback_prompt_version": FeedbackGenerator.PROMPT_VERSION,
+            "metrics_version": MetricsCalculator.VERSION,
+            "vad_enabled": self.config.vad_enabled,
+            "vad_energy_threshold_db": self.config.vad_energy_threshold_db,
+            "vad_min_speech_ratio": self.config.vad_min_speech_ratio,
+        }
+        encoded = json.dumps(fields, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def warm_up(self) -> None:
+        """Load models and API clients ahead of the first analysis."""
+        self._emotion_analyzer.backend
+        self._speech_transcriber.client
+    
+    def _create_audio_processor(self, workspace: AnalysisWorkspace) -> AudioProcessor:
+        """Build an audio processor bound to a single analysis workspace."""
+        return AudioProcessor(
+            chunk_duration_ms=self.chunk_duration_ms,
+            temp_dir=workspace.path,
+            sample_rate=self.config.audio_sample_rate,
+            channels=self.config.audio_channels,
+        )
     
     def analyze(
         self,
         video_path: Path,
-        progress_callback: Callable[[str, int, int], None] | None = None,
+        progress_callback: Callable[..., None] | None = None,
+        content_hash: str | None = None,
     ) -> AnalysisResult:
-        """Perform complete analysis of a lecture video."""
-        try:
-            # Extract audio
-            if progress_callback:
-                progress_callback("Extracting audio", 0, 1)
-            audio_path = self._audio_processor.extract_audio(video_path)
-            
-            # Segment and analyze
-            utterances: list[Utterance] = []
-            chunks = list(self._audio_processor.segment_audio(audio_path))
+        """
+        Perform complete analysis of a lecture video.
+        
+        Each call works in its own AnalysisWorkspace, so several analyses
+        can safely run in parallel on the same host.
+        
+        Extracted audio and per-chunk transcripts and emotion results are
+        stored in the artifact cache under the video's content hash, so an
+        interrupted analysis resumes from the last completed chunk. If
+        ``prepare_audio`` is still extracting the same audio, the analysis
+        waits for it and reads the prepared copy.
+        
+        The wall time, CPU time and bytes of each stage are recorded in the
+        process-wide instrumentation and summarized in ``result.timings``.
+        
+        Args:
+            video_path: Lecture video to analyze.
+            progress_callback: Called with (stage, current, total). While
+                segments are analyzed, a fourth argument carries the
+                LectureMetrics of the segments finished so far.
+            content_hash: SHA-256 of the video, computed if not given.
+        """
+        with collect() as timings, timed("analysis", cpu=False):
+            content_hash = content_hash or hash_file(video_path)
+            audio_key = self._audio_cache_key(content_hash)
             
-            for i, chunk in enumerate(chunks):
+            with AnalysisWorkspace() as workspace:
+                audio_processor = self._create_audio_processor(workspace)
+                
+                # Stream audio and analyze chunks as they are decoded
                 if progress_callback:
-                    progress_callback("Analyzing segments", i + 1, len(chunks))
+                    progress_callback("Extracting audio", 0, 1)
                 
-                transcript = self._speech_transcriber.transcribe(chunk.file_path)
-                emotion = self._emotion_analyzer.analyze(chunk.file_path)
+                self._wait_for_extraction(audio_key)
+                cached_audio = self._artifact_cache.get_path(audio_key, ".pcm")
+                if cached_audio:
+                    total_chunks = -(-cached_audio.stat().st_size // audio_processor.chunk_bytes)
+                    chunks = audio_processor.stream_pcm(cached_audio)
+                    utterances = self._analyze_chunks(
+                        chunks, total_chunks, content_hash, progress_callback
+                    )
+                else:
+                    duration_ms = audio_processor.probe_duration_ms(video_path)
+                    total_chunks = -(-duration_ms // self.chunk_duration_ms) if duration_ms else 0
+                    
+                    with self._artifact_cache.writer(audio_key, ".pcm") as tee:
+                        chunks = audio_processor.stream_audio(video_path, tee=tee)
+                        utterances = self._analyze_chunks(
+                            chunks, total_chunks, content_hash, progress_callback
+                        )
                 
-                utterances.append(Utterance(
-                    start_time_ms=chunk.start_time_ms,
-                    end_time_ms=chunk.end_time_ms,
-                    transcript=transcript,
-                    emotion=emotion,
-                ))
+                # Calculate metrics
+                store = UtteranceStore.from_utterances(utterances)
+                metrics = self._metrics_calculator.calculate(store)
+                
+                # Generate AI feedback while the visualizations are built
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    feedback_future = pool.submit(
+                        copy_context().run, self._feedback_generator.generate, metrics
+                    )
+                    timeline = self._chart_generator.create_engagement_timeline(store)
+                    feedback = feedback_future.result()
+                
+                return AnalysisResult(
+                    metrics=metrics,
+                    feedback=feedback,
+                    timeline=timeline,
+                    utterances=utterances,
+                    timings=timings.to_dict(),
+                )
+    
+    async def analyze_async(
+        self,
+        video_path: Path,
+        progress_callback: Callable[..., None] | None = None,
+        content_hash: str | None = None,
+    ) -> AnalysisResult:
+        """
+        Analyze a lecture video on an asyncio event loop.
+        
+        Produces the same result as ``analyze`` and shares its caches.
+        Transcription and feedback requests are awaited on async clients,
+        while decoding and emotion inference run in executors, so a single
+        event loop can supervise many analyses at once. Like ``analyze``,
+        it replays a prepared copy of the audio if one exists and otherwise
+        analyzes chunks while ffmpeg is still decoding them, storing a copy
+        for later runs.
+        
+        Args:
+            video_path: Lecture video to analyze.
+            progress_callback: Called on the event loop with the same
+                arguments as for ``analyze``; it must not block.
+            content_hash: SHA-256 of the video, computed if not given.
+        """
+        with collect() as timings, timed("analysis", cpu=False):
+            content_hash = content_hash or await asyncio.to_thread(hash_file, video_path)
             
-            # Calculate metrics
-            metrics = self._metrics_calculator.calculate(utterances)
+            audio_key = self._audio_cache_key(content_hash)
             
-            # Generate visualizations
-            timeline_html = self._chart_generator.create_engagement_timeline(utterances)
+            if progress_callback:
+                progress_callback("Extracting audio", 0, 1)
             
-            # Generate AI feedback
-            feedback = self._feedback_generator.generate(metrics)
+            with AnalysisWorkspace() as workspace:
+                audio_processor = self._create_audio_processor(workspace)
+                
+                await asyncio.to_thread(self._wait_for_extraction, audio_key)
+                cached_audio = self._artifact_cache.get_path(audio_key, ".pcm")
+                if cached_audio:
+                    total_chunks = -(-cached_audio.stat().st_size // audio_processor.chunk_bytes)
+                    with closing(audio_processor.stream_pcm(cached_audio)) as chunks:
+                        utterances = await self._analyze_chunks_async(
+                            chunks, total_chunks, content_hash, progress_callback
+                        )
+                else:
+                    duration_ms = await asyncio.to_thread(
+                        audio_processor.probe_duration_ms, video_path
+                    )
+                    total_chunks = -(-duration_ms // self.chunk_duration_ms) if duration_ms else 0
+                    
+                    with self._artifact_cache.writer(audio_key, ".pcm") as tee:
+                        # Closing the stream stops ffmpeg if the analysis fails.
+                        with closing(audio_processor.stream_audio(video_path, tee=tee)) as chunks:
+                            utterances = await self._analyze_chunks_async(
+                                chunks, total_chunks, content_hash, progress_callback
+                            )
+            
+            store = UtteranceStore.from_utterances(utterances)
+            metrics = self._metrics_calculator.calculate(store)
+            
+            feedback_task = asyncio.create_task(self._feedback_generator.generate_async(metrics))
+            timeline = await asyncio.to_thread(
+                self._chart_generator.create_engagement_timeline, store
+            )
             
             return AnalysisResult(
                 metrics=metrics,
-                feedback=feedback,
-                timeline_chart_html=timeline_html,
+                feedback=await feedback_task,
+                timeline=timeline,
                 utterances=utterances,
+                timings=timings.to_dict(),
             )
+    
+    def prepare_audio(self, video_path: Path, content_hash: str | None = None) -> Path:
+        """
+        Extract a video's audio into the artifact cache ahead of analysis.
+        
+        Concurrent calls for the same content share one extraction. Returns
+        the path of the cached PCM audio.
+        """
+        content_hash = content_hash or hash_file(video_path)
+        audio_key = self._audio_cache_key(content_hash)
+        
+        with _extractions_lock:
+            pending = _extractions.get(audio_key)
+            owner = pending is None
+            if owner:
+                pending = _extractions[audio_key] = threading.Event()
+        
+        if not owner:
+            pending.wait()
+            return self._artifact_cache.get_path(audio_key, ".pcm")
+        
+        try:
+            cached_audio = self._artifact_cache.get_path(audio_key, ".pcm")
+            if cached_audio:
+                return cached_audio
             
+            with AnalysisWorkspace() as workspace:
+                audio_processor = self._create_audio_processor(workspace)
+                with self._artifact_cache.writer(audio_key, ".pcm") as output:
+                    audio_processor.extract_pcm(video_path, output)
+            return self._artifact_cache.get_path(audio_key, ".pcm")
         finally:
-            self._audio_processor.cleanup()
-
+            with _extractions_lock:
+                del _extractions[audio_key]
+            pending.set()
+    
+    def _analyze_chunks(
+        self,
+        chunks: Iterable[AudioChunk],
+        total_chunks: int,
+        content_hash: str,
+        progress_callback: Callable[..., None] | None = None,
+    ) -> list[Utterance]:
+        """
+        Transcribe and classify chunks as an overlapped two-stage pipeline.
+        
+        Each chunk is decoded once into AudioFeatures, which voice activity
+        detection, transcription and emotion inference all share.
+        
+        Each chunk is then submitted to a bounded thread pool for network-bound
+        transcription as soon as it is decoded, while batched emotion
+        inference runs on the calling thread. Finished chunks are drained
+        strictly in submission order, so utterances stay in timeline order.
+        Chunks with cached results skip the corresponding service call, and
+        chunks the voice activity detector marks as silent skip both.
+        Running metrics are updated per utterance and reported with progress.
+        """
+        utterances: list[Utterance] = []
+        running = IncrementalMetrics()
+        # A None transcript future marks a silent chunk, whose features are
+        # dropped; it still counts towards the batch so progress keeps moving.
+        batch: list[tuple[AudioChunk, AudioFeatures | None, Future[str] | None]] = []
+        pending: deque[tuple[AudioChunk, Future[str] | None, EmotionResult | None]] = deque()
+        max_pending = max(
+            self.config.transcription_workers, self._emotion_analyzer.batch_size
+        )
+        
+        def classify_batch() -> None:
+            speech = [
+                (chunk, features)
+                for chunk, features, transcript in batch
+                if transcript is not None
+            ]
+            emotions = iter(self._classify_cached(
+                [chunk for chunk, _ in speech],
+                [features for _, features in speech],
+                content_hash,
+            ))
+            for chunk, _, transcript in batch:
+                emotion = next(emotions) if transcript is not None else None
+                pending.append((chunk, transcript, emotion))
+            batch.clear()
+        
+        def drain(limit: int) -> None:
+            while len(pending) > limit:
+                chunk, transcript, emotion = pending.popleft()
+                utterance = Utterance(
+                    start_time_ms=chunk.start_time_ms,
+                    end_time_ms=chunk.end_time_ms,
+                    transcript=transcript.result() if transcript is not None else "",
+                    emotion=emotion,
+                    is_speech=transcript is not None,
+                )
+                utterances.append(utterance)
+                running.add(utterance)
+                if progress_callback:
+                    progress_callback(
+                        "Analyzing segments",
+                        len(utterances),
+                        max(total_chunks, len(utterances)),
+                        running.snapshot(),
+                    )
+        
+        with ThreadPoolExecutor(
+            max_workers=self.config.transcription_workers,
+            thread_name_prefix="transcribe",
+        ) as pool:
+            try:
+                for chunk in chunks:
+                    features = decode_chunk(chunk, self.config.speech_sample_rate)
+                    if self._is_speech(features):
+                        transcript = pool.submit(
+                            copy_context().run,
+                            self._transcribe_cached,
+                            chunk,
+                            features,
+                            content_hash,
+                        )
+                    else:
+                        features = transcript = None
+                    batch.append((chunk, features, transcript))
+                    
+                    if len(batch) >= self._emotion_analyzer.batch_size:
+                        classify_batch()
+                        drain(max_pending)
+                
+                if batch:
+                    classify_batch()
+                drain(0)
+            except BaseException:
+                for _, _, transcript in batch:
+                    if transcript is not None:
+                        transcript.cancel()
+                for _, transcript, _ in pending:
+                    if transcript is not None:
+                        transcript.cancel()
+                raise
+        
+        return utterances
+    
+    async def _analyze_chunks_async(
+        self,
+        chunks: Iterable[AudioChunk],
+        total_chunks: int,
+        content_hash: str,
+        progress_callback: Callable[..., None] | None = None,
+    ) -> list[Utterance]:
+        """
+        Async counterpart of ``_analyze_chunks`` with the same pipeline shape.
+        
+        Chunks are read, decoded and checked for speech in a worker thread.
+        Transcriptions run as tasks, at most ``transcription_workers`` at a
+        time, and emotion batches are classified on the shared inference
+        executor. Utterances are emitted in timeline order.
+        """
+        loop = asyncio.get_running_loop()
+        utterances: list[Utterance] = []
+        running = IncrementalMetrics()
+        slots = asyncio.Semaphore(self.config.transcription_workers)
+        # A None transcript task marks a silent chunk, whose features are dropped.
+        batch: list[tuple[AudioChunk, AudioFeatures | None, asyncio.Task[str] | None]] = []
+        pending: deque[tuple[AudioChunk, asyncio.Task[str] | None, EmotionResult | None]] = deque()
+        max_pending = max(
+            self.config.transcription_workers, self._emotion_analyzer.batch_size
+        )
+        
+        iterator = iter(chunks)
+        
+        def read_next() -> tuple[AudioChunk, AudioFeatures, bool] | None:
+            chunk = next(iterator, None)
+            if chunk is None:
+                return None
+            features = decode_chunk(chunk, self.config.speech_sample_rate)
+            return chunk, features, self._is_speech(features)
+        
+        async def transcribe(chunk: AudioChunk, features: AudioFeatures) -> str:
+            async with slots:
+                return await self._transcribe_cached_async(chunk, features, content_hash)
+        
+        async def classify_batch() -> None:
+            speech = [
+                (chunk, features)
+                for chunk, features, transcript in batch
+                if transcript is not None
+            ]
+            emotions = iter(await loop.run_in_executor(
+                _inference_executor,
+                copy_context().run,
+                self._classify_cached,
+                [chunk for chunk, _ in speech],
+                [features for _, features in speech],
+                content_hash,
+            ))
+            for chunk, _, transcript in batch:
+                emotion = next(emotions) if transcript is not None else None
+                pending.append((chunk, transcript, emotion))
+            batch.clear()
+        
+        async def drain(limit: int) -> None:
+            while len(pending) > limit:
+                chunk, transcript, emotion = pending.popleft()
+                utterance = Utterance(
+                    start_time_ms=chunk.start_time_ms,
+                    end_time_ms=chunk.end_time_ms,
+                    transcript=await transcript if transcript is not None else "",
+                    emotion=emotion,
+                    is_speech=transcript is not None,
+                )
+                utterances.append(utterance)
+                running.add(utterance)
+                if progress_callback:
+                    progress_callback(
+                        "Analyzing segments",
+                        len(utterances),
+                        max(total_chunks, len(utterances)),
+                        running.snapshot(),
+                    )
+        
+        try:
+            while (item := await asyncio.to_thread(read_next)) is not None:
+                chunk, features, is_speech = item
+                if is_speech:
+                    batch.append((chunk, features, asyncio.create_task(transcribe(chunk, features))))
+                else:
+                    batch.append((chunk, None, None))
+                
+                if len(batch) >= self._emotion_analyzer.batch_size:
+                    await classify_batch()
+                    await drain(max_pending)
+            
+            if batch:
+                await classify_batch()
+            await drain(0)
+        except BaseException:
+            for _, _, transcript in batch:
+                if transcript is not None:
+                    transcript.cancel()
+            for _, transcript, _ in pending:
+                if transcript is not None:
+                    transcript.cancel()
+            raise
+        
+        return utterances
+    
+    def _is_speech(self, features: AudioFeatures) -> bool:
+        """Whether a chunk contains enough speech to be worth analyzing."""
+        if self._voice_detector is None:
+            return True
+        return self._voice_detector.detect(features).is_speech
+    
+    @staticmethod
+    def _wait_for_extraction(audio_key: str) -> None:
+        """Block until a running ``prepare_audio`` for this key has finished."""
+        with _extractions_lock:
+            pending = _extractions.get(audio_key)
+        if pending is not None:
+            pending.wait()
+    
+    def _audio_cache_key(self, content_hash: str) -> str:
+        return ArtifactCache.key(
+            content_hash,
+            "audio",
+            self.config.audio_sample_rate,
+            self.config.audio_channels,
+        )
+    
+    def _chunk_cache_key(
+        self,
+        content_hash: str,
+        service: str,
+        version: str,
+        chunk: AudioChunk,
+    ) -> str:
+        return ArtifactCache.key(
+            content_hash,
+            service,
+            version,
+            chunk.sample_rate,
+            chunk.channels,
+            chunk.start_time_ms,
+            chunk.end_time_ms,
+        )
+    
+    def _transcribe_cached(
+        self,
+        chunk: AudioChunk,
+        features: AudioFeatures,
+        content_hash: str,
+    ) -> str:
+        """Transcribe a chunk, reusing a cached transcript when available."""
+        key = self._chunk_cache_key(
+            content_hash, "speech", self._speech_transcriber.cache_version, chunk
+        )
+        cached = self._artifact_cache.get_json(key)
+        if cached is not None:
+            return cached["transcript"]
+        
+        transcript = self._speech_transcriber.transcribe(features)
+        self._artifact_cache.put_json(key, {"transcript": transcript})
+        return transcript
+    
+    async def _transcribe_cached_async(
+        self,
+        chunk: AudioChunk,
+        features: AudioFeatures,
+        content_hash: str,
+    ) -> str:
+        """Await the transcript of a chunk, reusing a cached one if present."""
+        key = self._chunk_cache_key(
+            content_hash, "speech", self._speech_transcriber.cache_version, chunk
+        )
+        cached = await asyncio.to_thread(self._artifact_cache.get_json, key)
+        if cached is not None:
+            return cached["transcript"]
+        
+        transcript = await self._speech_transcriber.transcribe_async(features)
+        await asyncio.to_thread(self._artifact_cache.put_json, key, {"transcript": transcript})
+        return transcript
+    
+    def _classify_cached(
+        self,
+        chunks: list[AudioChunk],
+        features: list[AudioFeatures],
+        content_hash: str,
+    ) -> list[EmotionResult]:
+        """Classify chunks in one batch, skipping those with cached results."""
+        version = self._emotion_analyzer.cache_version
+        keys = [
+            self._chunk_cache_key(content_hash, "emotion", version, chunk)
+            for chunk in chunks
+        ]
+        
+        emotions: list[EmotionResult | None] = []
+        for key in keys:
+            cached = self._artifact_cache.get_json(key)
+            emotions.append(EmotionResult.from_scores(cached) if cached else None)
+        
+        missing = [i for i, emotion in enumerate(emotions) if emotion is None]
+        if missing:
+            results = self._emotion_analyzer.analyze_batch([features[i] for i in missing])
+            for i, emotion in zip(missing, results):
+                self._artifact_cache.put_json(keys[i], emotion.raw_scores)
+                emotions[i] = emotion
+        
+        return emotions
@@ -4,37 +4,79 @@ Audio processing service for extracting and segmenting audio from videos.
 
 from __future__ import annotations
 
+import os
+import subprocess
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import BinaryIO, Iterator
 
-from moviepy.editor import VideoFileClip
+import numpy as np
+from imageio_ffmpeg import get_ffmpeg_exe
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
 from pydub import AudioSegment
 
+from .instrumentation import timed
+from .segmentation import PauseSegmenter
+
 
 @dataclass
 class AudioChunk:
-    """Represents a segment of audio with timing information."""
+    """
+    Represents a segment of audio with timing information.
+    
+    A chunk is backed either by a WAV file on disk (``file_path``) or by an
+    in-memory buffer of 16-bit PCM samples shaped ``(frames, channels)``.
+    """
     
     start_time_ms: int
     end_time_ms: int
-    file_path: Path
+    file_path: Path | None = None
+    samples: np.ndarray | None = None
+    sample_rate: int = 44100
+    channels: int = 2
     
     @property
     def duration_ms(self) -> int:
         """Duration of the chunk in milliseconds."""
         return self.end_time_ms - self.start_time_ms
+    
+    @property
+    def in_memory(self) -> bool:
+        """Whether the chunk holds its PCM samples in memory."""
+        return self.samples is not None
+    
+    def to_pcm_bytes(self) -> bytes:
+        """Return the chunk audio as bytes suitable for a LINEAR16 request."""
+        if self.samples is not None:
+            return self.samples.astype("<i2", copy=False).tobytes()
+        with open(self.file_path, "rb") as f:
+            return f.read()
+    
+    def to_mono_float32(self) -> np.ndarray:
+        """Return the in-memory samples downmixed to mono in [-1.0, 1.0]."""
+        if self.samples is None:
+            raise ValueError("Chunk has no in-memory samples")
+        mono = self.samples.mean(axis=1, dtype=np.float32)
+        return mono / np.float32(32768.0)
 
 
 class AudioProcessor:
     """
     Handles audio extraction from video files and segmentation into chunks.
+    
+    Chunk boundaries are chosen by a PauseSegmenter, so chunks are about
+    ``chunk_duration_ms`` long, end in pauses, and cover the whole recording.
     """
     
     def __init__(
         self,
         chunk_duration_ms: int = 30000,
         temp_dir: Path | None = None,
+        in_memory: bool = True,
+        sample_rate: int = 16000,
+        channels: int = 1,
+        segmenter: PauseSegmenter | None = None,
     ) -> None:
         """
         Initialize the audio processor.
@@ -42,47 +84,197 @@ class AudioProcessor:
         Args:
             chunk_duration_ms: Duration of each chunk (default: 30 seconds).
             temp_dir: Directory for temporary files.
+            in_memory: Keep chunk samples in memory instead of exporting
+                one WAV file per chunk.
+            sample_rate: Target sample rate for streamed audio.
+            channels: Target channel count for streamed audio.
+            segmenter: Boundary selection; defaults to pause-aligned cuts
+                around ``chunk_duration_ms``.
         """
         self.chunk_duration_ms = chunk_duration_ms
+        self.in_memory = in_memory
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.segmenter = segmenter or PauseSegmenter(
+            target_ms=chunk_duration_ms,
+            min_ms=min(10000, chunk_duration_ms),
+            max_ms=max(55000, chunk_duration_ms),
+        )
         self.temp_dir = temp_dir or Path(__file__).parent.parent.parent.parent / "data" / "audio"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
     
-    def extract_audio(self, video_path: Path) -> Path:
-        """Extract audio track from a video file."""
-        audio_path = self.temp_dir / "extracted_audio.wav"
+    def probe_duration_ms(self, video_path: Path) -> int | None:
+        """Read the media duration from the container header, if known."""
+        try:
+            infos = ffmpeg_parse_infos(str(video_path))
+        except (IOError, OSError):
+            return None
+        duration = infos.get("duration")
+        return int(duration * 1000) if duration else None
+    
+    def stream_audio(
+        self,
+        video_path: Path,
+        tee: BinaryIO | None = None,
+    ) -> Iterator[AudioChunk]:
+        """
+        Decode the audio track with ffmpeg and yield chunks as they arrive.
+        
+        Audio is resampled and downmixed by ffmpeg to the configured target
+        format and read from its stdout incrementally, so memory use stays
+        bounded by the segmenter's lookahead regardless of the video length.
         
-        video = VideoFileClip(str(video_path))
-        video.audio.write_audiofile(str(audio_path), logger=None)
-        video.close()
+        Args:
+            video_path: Video (or audio) file to decode.
+            tee: Optional binary file that receives a copy of the raw PCM
+                stream, which ``stream_pcm`` can replay later.
+        """
+        # ffmpeg's log goes to a file: a pipe nobody reads while stdout is
+        # being consumed would fill up and block ffmpeg on a damaged input.
+        with tempfile.TemporaryFile() as log:
+            process = subprocess.Popen(
+                self._decode_command(video_path),
+                stdout=subprocess.PIPE,
+                stderr=log,
+                bufsize=self.chunk_bytes,
+            )
+            
+            completed = False
+            try:
+                yield from self._read_chunks(process.stdout, tee)
+                completed = True
+            finally:
+                process.stdout.close()
+                if not completed and process.poll() is None:
+                    process.kill()
+                return_code = process.wait()
+                log.seek(0)
+                stderr = log.read().decode(errors="replace")
         
-        return audio_path
+        if return_code != 0:
+            raise RuntimeError(f"ffmpeg failed to decode {video_path}: {stderr.strip()}")
     
-    def segment_audio(self, audio_path: Path) -> Iterator[AudioChunk]:
-        """Segment audio file into chunks of specified duration."""
-        audio = AudioSegment.from_wav(str(audio_path))
-        total_duration = len(audio)
+    def extract_pcm(self, video_path: Path, output: BinaryIO) -> None:
+        """
+        Decode the audio track to raw PCM in ``output`` without chunking it.
+        
+        The result has the same format as the ``tee`` copy written by
+        ``stream_audio`` and can be replayed with ``stream_pcm``.
+        """
+        with timed("extraction") as span:
+            result = subprocess.run(
+                self._decode_command(video_path),
+                stdout=output,
+                stderr=subprocess.PIPE,
+            )
+            span.bytes = os.fstat(output.fileno()).st_size
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace")
+            raise RuntimeError(f"ffmpeg failed to decode {video_path}: {stderr.strip()}")
+    
+    def _decode_command(self, video_path: Path) -> list[str]:
+        """Build the ffmpeg command that writes the target PCM format to stdout."""
+        return [
+            get_ffmpeg_exe(),
+            "-nostdin",
+            "-loglevel", "error",
+            "-i", str(video_path),
+            "-vn",
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "-ac", str(self.channels),
+            "-ar", str(self.sample_rate),
+            "pipe:1",
+        ]
+    
+    def stream_pcm(self, pcm_path: Path) -> Iterator[AudioChunk]:
+        """
+        Yield chunks from a raw PCM file previously captured by ``stream_audio``.
         
-        current_position = 0
-        chunk_index = 0
+        The file must use the processor's sample rate and channel layout.
+        """
+        with open(pcm_path, "rb") as f:
+            yield from self._read_chunks(f)
+    
+    @property
+    def chunk_bytes(self) -> int:
+        """Size in bytes of one target-length chunk of 16-bit PCM at the target format."""
+        frames_per_chunk = self.chunk_duration_ms * self.sample_rate // 1000
+        return frames_per_chunk * self.channels * 2
+    
+    def _read_chunks(
+        self,
+        stream: BinaryIO,
+        tee: BinaryIO | None = None,
+    ) -> Iterator[AudioChunk]:
+        """Cut a 16-bit PCM byte stream into pause-aligned chunks."""
+        frame_bytes = self.channels * 2
+        lookahead = self.segmenter.lookahead_frames(self.sample_rate)
+        buffer = np.empty((0, self.channels), dtype=np.int16)
+        position = 0
+        end_of_stream = False
         
-        while current_position < total_duration - self.chunk_duration_ms:
-            end_position = current_position + self.chunk_duration_ms
-            chunk = audio[current_position:end_position]
+        while True:
+            while not end_of_stream and len(buffer) < lookahead:
+                with timed("extraction") as span:
+                    data = stream.read(self.chunk_bytes)
+                    span.bytes = len(data)
+                if tee is not None:
+                    tee.write(data)
+                if not data:
+                    end_of_stream = True
+                    break
+                
+                data = data[:len(data) - len(data) % frame_bytes]
+                samples = np.frombuffer(data, dtype="<i2").reshape(-1, self.channels)
+                buffer = np.concatenate([buffer, samples])
             
-            chunk_path = self.temp_dir / f"chunk_{chunk_index:04d}.wav"
-            chunk.export(str(chunk_path), format="wav")
+            if not len(buffer):
+                return
             
+            with timed("segmentation", nbytes=buffer.nbytes):
+                cut = self.segmenter.next_cut(buffer, self.sample_rate)
             yield AudioChunk(
-                start_time_ms=current_position,
-                end_time_ms=end_position,
-                file_path=chunk_path,
+                start_time_ms=position * 1000 // self.sample_rate,
+                end_time_ms=(position + cut) * 1000 // self.sample_rate,
+                samples=buffer[:cut],
+                sample_rate=self.sample_rate,
+                channels=self.channels,
             )
             
-            current_position = end_position
-            chunk_index += 1
+            buffer = buffer[cut:]
+            position += cut
     
-    def cleanup(self) -> None:
-        """Remove all temporary audio files."""
-        for file in self.temp_dir.glob("*.wav"):
-            file.unlink()
+    def segment_audio(self, audio_path: Path) -> Iterator[AudioChunk]:
+        """Segment an audio file into pause-aligned chunks covering all of it."""
+        audio = AudioSegment.from_wav(str(audio_path)).set_sample_width(2)
+        samples = np.array(audio.get_array_of_samples(), dtype=np.int16)
+        samples = samples.reshape(-1, audio.channels)
+        
+        for chunk_index, (start_frame, end_frame) in enumerate(
+            self.segmenter.boundaries(samples, audio.frame_rate)
+        ):
+            start_position = start_frame * 1000 // audio.frame_rate
+            end_position = end_frame * 1000 // audio.frame_rate
+            
+            if self.in_memory:
+                yield AudioChunk(
+                    start_time_ms=start_position,
+                    end_time_ms=end_position,
+                    samples=samples[start_frame:end_frame],
+                    sample_rate=audio.frame_rate,
+                    channels=audio.channels,
+                )
+            else:
+                chunk = audio.get_sample_slice(start_frame, end_frame)
+                chunk_path = self.temp_dir / f"chunk_{chunk_index:04d}.wav"
+                chunk.export(str(chunk_path), format="wav")
+                
+                yield AudioChunk(
+                    start_time_ms=start_position,
+                    end_time_ms=end_position,
+                    file_path=chunk_path,
+                    sample_rate=audio.frame_rate,
+                    channels=audio.channels,
+                )
 
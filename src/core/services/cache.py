@@ -0,0 +1,192 @@
+"""
+Persistent artifact cache for intermediate analysis results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+
+CACHE_ROOT = Path(__file__).parent.parent.parent.parent / "data" / "cache"
+
+
+def hash_file(path: Path, block_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 of a file, reading it in fixed-size blocks."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Two-level cache for analysis artifacts with a disk budget.
+    
+    Small JSON artifacts (transcripts, emotion scores) are kept in an
+    in-memory LRU in front of the disk store. Large artifacts such as
+    extracted audio are stored as files and handed out by path. Reads
+    refresh an entry's modification time, and when the disk store grows
+    past ``max_bytes`` the least recently used files are evicted.
+    
+    Example:
+        cache = ArtifactCache()
+        key = cache.key(content_hash, "speech", "1", "0-30000")
+        cache.put_json(key, {"transcript": "..."})
+    """
+    
+    # Fraction of ``max_bytes`` that eviction shrinks the store down to.
+    LOW_WATER_MARK = 0.9
+    
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int = 5 * 1024 ** 3,
+        memory_items: int = 1024,
+    ) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            root: Directory for cached files.
+            max_bytes: Disk budget before least recently used entries are evicted.
+            memory_items: Number of JSON entries kept in memory.
+        """
+        self.root = root or CACHE_ROOT
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.root.mkdir(parents=True, exist_ok=True)
+        
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._size: int | None = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(*parts: object) -> str:
+        """Build a cache key from content hash, service, version and detail parts."""
+        return hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+    
+    def get_json(self, key: str) -> Any | None:
+        """Return a cached JSON value, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        
+        path = self._path(key, ".json")
+        try:
+            with open(path) as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        self._touch(path)
+        self._remember(key, value)
+        return value
+    
+    def put_json(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        with self.writer(key, ".json") as f:
+            f.write(json.dumps(value).encode())
+        self._remember(key, value)
+    
+    def get_path(self, key: str, suffix: str = "") -> Path | None:
+        """Return the path of a cached file, or None on a miss."""
+        path = self._path(key, suffix)
+        if not path.exists():
+            return None
+        self._touch(path)
+        return path
+    
+    @contextmanager
+    def writer(self, key: str, suffix: str = "") -> Iterator[BinaryIO]:
+        """
+        Open a file that becomes the cache entry once the block exits.
+        
+        The entry is written to a temporary file and atomically moved into
+        place, so readers never see partial artifacts. If the block raises,
+        nothing is stored.
+        """
+        path = self._path(key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            try:
+                replaced_bytes = path.stat().st_size
+            except OSError:
+                replaced_bytes = 0
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        
+        self._account(path.stat().st_size - replaced_bytes)
+    
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+    
+    def _remember(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+    
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    
+    def _account(self, added_bytes: int) -> None:
+        """Track the store size after a write, net of any file it replaced."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._scan())
+            else:
+                self._size += added_bytes
+            
+            if self._size > self.max_bytes:
+                self._evict()
+    
+    def _scan(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob("*/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def _evict(self) -> None:
+        """
+        Delete least recently used files until the store is back under its
+        low-water mark, so the next writes do not each trigger a full scan.
+        """
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * self.LOW_WATER_MARK
+        
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            self._memory.pop(path.stem, None)
+            total -= size
+        
+        self._size = total
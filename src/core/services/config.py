@@ -26,8 +26,35 @@ class Config:
     
     # Audio processing settings
     chunk_duration_ms: int = 30000  # 30 seconds
-    audio_sample_rate: int = 44100
-    audio_channels: int = 2
+    audio_sample_rate: int = 16000  # Target rate for streamed audio
+    audio_channels: int = 1  # Target layout for streamed audio (1 = mono)
+    
+    # Emotion inference settings
+    emotion_batch_size: int = 8  # Chunks per wav2vec2 forward pass
+    torch_num_threads: int = 0  # 0 = torch default
+    emotion_backend: str = "torch"  # torch, torch-int8 or onnx
+    
+    # Transcription settings
+    transcription_workers: int = 4  # Concurrent Speech API requests per analysis
+    speech_sample_rate: int = 16000  # Sample rate of audio uploaded to Speech
+    speech_encoding: str = "LINEAR16"  # LINEAR16 or FLAC
+    speech_requests_per_second: float = 10.0  # Process-wide quota (0 = unlimited)
+    speech_max_concurrency: int = 8  # Process-wide in-flight request limit
+    speech_timeout_s: float = 60.0  # Deadline per request attempt
+    speech_max_attempts: int = 5  # Attempts per request, including retries
+    
+    # Voice activity detection settings
+    vad_enabled: bool = True  # Skip transcription and emotion for silent chunks
+    vad_energy_threshold_db: float = -45.0  # Minimum speech frame level (dBFS)
+    vad_min_speech_ratio: float = 0.1  # Fraction of speech frames for a speech chunk
+    
+    # Artifact cache settings
+    cache_max_bytes: int = 5 * 1024 ** 3  # Disk budget for cached artifacts
+    
+    # Feedback generation settings
+    feedback_timeout_s: float = 20.0  # Latency budget before falling back
+    feedback_cache_size: int = 256  # Cached responses kept in memory
+    feedback_cache_ttl_s: float = 7 * 24 * 3600  # Age after which a response expires
     
     _instance: Optional[Config] = None
     
@@ -40,10 +67,12 @@ class Config:
         - GOOGLE_CLOUD_KEY_PATH
         - OPENAI_API_KEY
         - HUGGINGFACE_API_KEY
+        
+        EDUVISOR_EMOTION_BACKEND optionally selects the emotion backend.
         """
         if cls._instance is not None:
             return cls._instance
-            
+        
         # Try environment variables first
         google_key = os.environ.get("GOOGLE_CLOUD_KEY_PATH")
         openai_key = os.environ.get("OPENAI_API_KEY")
@@ -73,6 +102,7 @@ class Config:
             google_cloud_key_path=google_key,
             openai_api_key=openai_key,
             hugging_face_api_key=hf_key,
+            emotion_backend=os.environ.get("EDUVISOR_EMOTION_BACKEND", cls.emotion_backend),
         )
         
         return cls._instance
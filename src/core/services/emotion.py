@@ -6,10 +6,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Sequence
 
-from transformers import pipeline
+import numpy as np
+from transformers.pipelines.audio_utils import ffmpeg_read
 
+from .audio import AudioChunk
+from .features import AudioFeatures, decode_chunk
+from .emotion_backends import EmotionBackend, create_backend
+from .instrumentation import timed
+from .registry import model_registry
 
 EmotionLabel = Literal[
     "angry", "calm", "disgust", "fearful", "happy", "neutral", "sad", "surprised"
@@ -33,6 +39,22 @@ class EmotionResult:
     def is_engaging(self) -> bool:
         """Check if the dominant emotion is considered engaging."""
         return self.engagement_level == "engaging"
+    
+    @classmethod
+    def from_scores(cls, scores: dict[EmotionLabel, float]) -> EmotionResult:
+        """Derive the dominant emotion and engagement level from raw scores."""
+        dominant_emotion = max(scores, key=lambda k: scores[k])
+        
+        engagement_level: EngagementLevel = (
+            "engaging" if dominant_emotion in ENGAGING_EMOTIONS else "non-engaging"
+        )
+        
+        return cls(
+            raw_scores=scores,
+            dominant_emotion=dominant_emotion,
+            engagement_level=engagement_level,
+            confidence=scores[dominant_emotion],
+        )
 
 
 class EmotionAnalyzer:
@@ -42,37 +64,89 @@ class EmotionAnalyzer:
     
     MODEL_ID = "ehcalabres/wav2vec2-lg-xlsr-en-speech-emotion-recognition"
     
-    def __init__(self) -> None:
-        """Initialize the emotion analyzer."""
-        self._pipeline = None
+    # Bump when a change alters results for the same model and audio.
+    VERSION = "2"
+    
+    def __init__(
+        self,
+        batch_size: int = 8,
+        num_threads: int = 0,
+        backend: str = "torch",
+    ) -> None:
+        """
+        Initialize the emotion analyzer.
+        
+        Args:
+            batch_size: Number of chunks per forward pass in analyze_batch.
+            num_threads: Intra-op thread count (0 keeps the runtime default).
+            backend: Inference backend name (see ``emotion_backends.BACKENDS``).
+        """
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.backend_name = backend
+        self._backend: EmotionBackend | None = None
     
     @property
-    def pipeline(self):
-        """Lazy-load the classification pipeline."""
-        if self._pipeline is None:
-            self._pipeline = pipeline("audio-classification", model=self.MODEL_ID)
-        return self._pipeline
+    def backend(self) -> EmotionBackend:
+        """Lazy-load the inference backend, shared across the process."""
+        if self._backend is None:
+            self._backend = model_registry.get(
+                f"emotion:{self.backend_name}:{self.MODEL_ID}",
+                lambda: create_backend(self.backend_name, self.MODEL_ID, self.num_threads),
+            )
+        return self._backend
     
-    def analyze(self, audio_path: Path) -> EmotionResult:
-        """Analyze the emotion in an audio file."""
-        results = self.pipeline(str(audio_path))
+    @property
+    def cache_version(self) -> str:
+        """Identifies the model, backend and code version behind a result."""
+        return f"{self.MODEL_ID}@{self.VERSION}/{self.backend_name}"
+    
+    def analyze(self, audio: Path | AudioChunk | AudioFeatures) -> EmotionResult:
+        """Analyze the emotion in an audio file, audio chunk or decoded waveform."""
+        return self.analyze_batch([audio])[0]
+    
+    def analyze_batch(
+        self,
+        audios: Sequence[Path | AudioChunk | AudioFeatures],
+        batch_size: int | None = None,
+    ) -> list[EmotionResult]:
+        """
+        Analyze many audio segments using padded, batched forward passes.
         
-        scores: dict[EmotionLabel, float] = {
-            result["label"]: result["score"]
-            for result in results
-        }
+        Results are returned in the same order as the inputs.
+        """
+        batch_size = batch_size or self.batch_size
+        backend = self.backend
         
-        dominant_emotion = max(scores, key=lambda k: scores[k])
-        confidence = scores[dominant_emotion]
+        results: list[EmotionResult] = []
         
-        engagement_level: EngagementLevel = (
-            "engaging" if dominant_emotion in ENGAGING_EMOTIONS else "non-engaging"
-        )
+        for start in range(0, len(audios), batch_size):
+            waveforms = [
+                self.load_waveform(audio, backend.sampling_rate)
+                for audio in audios[start:start + batch_size]
+            ]
+            with timed("emotion", nbytes=sum(w.nbytes for w in waveforms)):
+                probabilities = backend.predict(waveforms)
+            
+            for row in probabilities:
+                scores: dict[EmotionLabel, float] = {
+                    label: float(score)
+                    for label, score in zip(backend.labels, row)
+                }
+                results.append(EmotionResult.from_scores(scores))
         
-        return EmotionResult(
-            raw_scores=scores,
-            dominant_emotion=dominant_emotion,
-            engagement_level=engagement_level,
-            confidence=confidence,
-        )
-
+        return results
+    
+    def load_waveform(
+        self,
+        audio: Path | AudioChunk | AudioFeatures,
+        sampling_rate: int,
+    ) -> np.ndarray:
+        """Decode an audio input to a mono float32 waveform at the model rate."""
+        if isinstance(audio, AudioFeatures):
+            return audio.resample(sampling_rate).waveform
+        if isinstance(audio, AudioChunk):
+            return decode_chunk(audio, sampling_rate).waveform
+        
+        with open(audio, "rb") as f:
+            return ffmpeg_read(f.read(), sampling_rate)
@@ -0,0 +1,179 @@
+"""
+Inference backends for the speech emotion recognition model.
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+import torch
+from transformers import AutoFeatureExtractor, AutoModelForAudioClassification
+
+
+# Kept outside the artifact cache root so exported graphs are never evicted.
+ONNX_DIR = Path(__file__).parent.parent.parent.parent / "data" / "models" / "onnx"
+
+
+class EmotionBackend(ABC):
+    """
+    Runs the audio classification model on batches of waveforms.
+    
+    Subclasses only implement model loading and the forward pass; feature
+    extraction and padding are shared so every backend sees identical inputs.
+    """
+    
+    name: str = ""
+    
+    def __init__(self, model_id: str, num_threads: int = 0) -> None:
+        self.model_id = model_id
+        self.num_threads = num_threads
+        self.feature_extractor = AutoFeatureExtractor.from_pretrained(model_id)
+        self.labels: list[str] = []
+        self.load()
+    
+    @property
+    def sampling_rate(self) -> int:
+        """Sample rate the model expects its input waveforms at."""
+        return self.feature_extractor.sampling_rate
+    
+    @abstractmethod
+    def load(self) -> None:
+        """Load the model and populate ``labels``."""
+    
+    @abstractmethod
+    def forward(self, input_values: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """Return the logits for a padded batch, shaped (batch, labels)."""
+    
+    def predict(self, waveforms: list[np.ndarray]) -> np.ndarray:
+        """Return label probabilities for a batch of mono 16 kHz waveforms."""
+        inputs = self.feature_extractor(
+            waveforms,
+            sampling_rate=self.sampling_rate,
+            padding=True,
+            return_attention_mask=True,
+            return_tensors="np",
+        )
+        logits = self.forward(
+            inputs["input_values"].astype(np.float32),
+            inputs["attention_mask"].astype(np.int64),
+        )
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+
+class TorchBackend(EmotionBackend):
+    """Reference fp32 PyTorch backend."""
+    
+    name = "torch"
+    
+    def load(self) -> None:
+        if self.num_threads > 0:
+            torch.set_num_threads(self.num_threads)
+        self.model = AutoModelForAudioClassification.from_pretrained(self.model_id).eval()
+        self.labels = [self.model.config.id2label[i] for i in range(self.model.config.num_labels)]
+    
+    def forward(self, input_values: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        with torch.inference_mode():
+            logits = self.model(
+                input_values=torch.from_numpy(input_values),
+                attention_mask=torch.from_numpy(attention_mask),
+            ).logits
+        return logits.float().numpy()
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """PyTorch backend with dynamic int8 quantization of all Linear layers."""
+    
+    name = "torch-int8"
+    
+    def load(self) -> None:
+        super().load()
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+class OnnxBackend(EmotionBackend):
+    """
+    ONNX Runtime backend running an exported graph of the model.
+    
+    The graph is exported once per model and reused from ``ONNX_DIR``.
+    Requires the optional ``onnxruntime`` package.
+    """
+    
+    name = "onnx"
+    
+    def load(self) -> None:
+        try:
+            import onnxruntime
+        except ImportError as exc:
+            raise ImportError(
+                "The onnx emotion backend requires the onnxruntime package"
+            ) from exc
+        
+        model = AutoModelForAudioClassification.from_pretrained(self.model_id).eval()
+        self.labels = [model.config.id2label[i] for i in range(model.config.num_labels)]
+        
+        graph_path = ONNX_DIR / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', self.model_id)}.onnx"
+        if not graph_path.exists():
+            self._export(model, graph_path)
+        del model
+        
+        options = onnxruntime.SessionOptions()
+        if self.num_threads > 0:
+            options.intra_op_num_threads = self.num_threads
+        self.session = onnxruntime.InferenceSession(
+            str(graph_path), options, providers=["CPUExecutionProvider"]
+        )
+    
+    def forward(self, input_values: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        (logits,) = self.session.run(
+            ["logits"],
+            {"input_values": input_values, "attention_mask": attention_mask},
+        )
+        return logits
+    
+    def _export(self, model, graph_path: Path) -> None:
+        """Export the model to ONNX with dynamic batch and time axes."""
+        graph_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = graph_path.with_suffix(".tmp")
+        
+        dummy_values = torch.zeros(1, self.sampling_rate, dtype=torch.float32)
+        dummy_mask = torch.ones(1, self.sampling_rate, dtype=torch.int64)
+        
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (dummy_values, dummy_mask),
+                str(tmp_path),
+                input_names=["input_values", "attention_mask"],
+                output_names=["logits"],
+                dynamic_axes={
+                    "input_values": {0: "batch", 1: "samples"},
+                    "attention_mask": {0: "batch", 1: "samples"},
+                    "logits": {0: "batch"},
+                },
+                opset_version=14,
+            )
+        tmp_path.replace(graph_path)
+
+
+BACKENDS: dict[str, type[EmotionBackend]] = {
+    backend.name: backend
+    for backend in (TorchBackend, QuantizedTorchBackend, OnnxBackend)
+}
+
+
+def create_backend(name: str, model_id: str, num_threads: int = 0) -> EmotionBackend:
+    """Instantiate an emotion backend by name."""
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown emotion backend {name!r}; expected one of {sorted(BACKENDS)}"
+        ) from None
+    return backend_class(model_id, num_threads=num_threads)
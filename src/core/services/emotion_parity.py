@@ -0,0 +1,101 @@
+"""
+Accuracy parity checks for emotion inference backends.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from transformers import pipeline
+
+from .emotion import EmotionAnalyzer
+from .emotion_backends import create_backend
+
+
+@dataclass
+class ParityReport:
+    """Agreement of one backend with the reference pipeline on an audio set."""
+    
+    backend: str
+    sample_count: int
+    label_agreement: float
+    mean_score_drift: float
+    max_score_drift: float
+    seconds_per_sample: float
+    
+    def to_dict(self) -> dict:
+        return {
+            "backend": self.backend,
+            "samples": self.sample_count,
+            "label_agreement": round(self.label_agreement, 4),
+            "mean_score_drift": round(self.mean_score_drift, 6),
+            "max_score_drift": round(self.max_score_drift, 6),
+            "seconds_per_sample": round(self.seconds_per_sample, 3),
+        }
+
+
+def run_parity(
+    audio_paths: Sequence[Path],
+    backends: Sequence[str] = ("torch", "torch-int8", "onnx"),
+    model_id: str = EmotionAnalyzer.MODEL_ID,
+    batch_size: int = 8,
+) -> list[ParityReport]:
+    """
+    Compare emotion backends against the Hugging Face reference pipeline.
+    
+    For each backend, reports the fraction of samples whose dominant label
+    matches the reference and the absolute drift of per-label scores.
+    
+    Args:
+        audio_paths: Fixed set of audio files to evaluate.
+        backends: Backend names to compare.
+        model_id: Model to load in the reference and every backend.
+        batch_size: Samples per forward pass for the backends.
+    """
+    reference_pipeline = pipeline("audio-classification", model=model_id, top_k=None)
+    labels = [
+        reference_pipeline.model.config.id2label[i]
+        for i in range(reference_pipeline.model.config.num_labels)
+    ]
+    sampling_rate = reference_pipeline.feature_extractor.sampling_rate
+    
+    analyzer = EmotionAnalyzer()
+    waveforms = [analyzer.load_waveform(path, sampling_rate) for path in audio_paths]
+    
+    reference = np.array([
+        _ordered_scores(reference_pipeline(waveform), labels)
+        for waveform in waveforms
+    ])
+    
+    reports = []
+    for name in backends:
+        backend = create_backend(name, model_id)
+        column_order = [backend.labels.index(label) for label in labels]
+        
+        started = time.perf_counter()
+        scores = np.concatenate([
+            backend.predict(waveforms[start:start + batch_size])
+            for start in range(0, len(waveforms), batch_size)
+        ])[:, column_order]
+        elapsed = time.perf_counter() - started
+        
+        drift = np.abs(scores - reference)
+        reports.append(ParityReport(
+            backend=name,
+            sample_count=len(waveforms),
+            label_agreement=float(np.mean(scores.argmax(axis=1) == reference.argmax(axis=1))),
+            mean_score_drift=float(drift.mean()),
+            max_score_drift=float(drift.max()),
+            seconds_per_sample=elapsed / len(waveforms),
+        ))
+    
+    return reports
+
+
+def _ordered_scores(results: list[dict], labels: list[str]) -> list[float]:
+    scores = {result["label"]: result["score"] for result in results}
+    return [scores[label] for label in labels]
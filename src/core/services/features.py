@@ -0,0 +1,82 @@
+"""
+Shared audio decoding stage feeding the speech and emotion services.
+"""
+
+from __future__ import annotations
+
+import wave
+from dataclasses import dataclass
+from math import gcd
+
+import numpy as np
+from scipy.signal import resample_poly
+
+from .audio import AudioChunk
+from .instrumentation import timed
+
+
+@dataclass
+class AudioFeatures:
+    """
+    A chunk decoded once to a mono float32 waveform in [-1.0, 1.0].
+    
+    Both the transcriber and the emotion analyzer accept this directly, so
+    a chunk is downmixed and resampled a single time however many services
+    consume it.
+    """
+    
+    waveform: np.ndarray
+    sample_rate: int
+    
+    @property
+    def duration_ms(self) -> int:
+        return len(self.waveform) * 1000 // self.sample_rate
+    
+    def resample(self, sample_rate: int) -> AudioFeatures:
+        """Return the waveform at another sample rate (self if unchanged)."""
+        if sample_rate == self.sample_rate:
+            return self
+        divisor = gcd(self.sample_rate, sample_rate)
+        waveform = resample_poly(
+            self.waveform, sample_rate // divisor, self.sample_rate // divisor
+        )
+        return AudioFeatures(waveform=waveform.astype(np.float32), sample_rate=sample_rate)
+    
+    def to_pcm16(self) -> bytes:
+        """Return the waveform as little-endian 16-bit PCM."""
+        scaled = np.rint(self.waveform * np.float32(32768.0))
+        return np.clip(scaled, -32768, 32767).astype("<i2").tobytes()
+
+
+def decode_chunk(chunk: AudioChunk, sample_rate: int = 16000) -> AudioFeatures:
+    """
+    Decode a chunk to mono float32 at ``sample_rate``.
+    
+    In-memory chunks are converted directly; file-backed chunks are read
+    as 16-bit WAV without spawning a decoder process.
+    """
+    with timed("decoding") as span:
+        if chunk.in_memory:
+            samples, source_rate = chunk.samples, chunk.sample_rate
+        else:
+            samples, source_rate = _read_wav(chunk)
+        span.bytes = samples.nbytes
+        
+        if samples.shape[1] > 1:
+            mono = samples.mean(axis=1, dtype=np.float32)
+        else:
+            mono = samples.reshape(-1).astype(np.float32)
+        
+        features = AudioFeatures(waveform=mono / np.float32(32768.0), sample_rate=source_rate)
+        return features.resample(sample_rate)
+
+
+def _read_wav(chunk: AudioChunk) -> tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV chunk file into a (frames, channels) array."""
+    with wave.open(str(chunk.file_path), "rb") as f:
+        if f.getsampwidth() != 2:
+            raise ValueError(f"Expected 16-bit PCM in {chunk.file_path}")
+        frames = f.readframes(f.getnframes())
+        channels = f.getnchannels()
+        rate = f.getframerate()
+    return np.frombuffer(frames, dtype="<i2").reshape(-1, channels), rate
@@ -0,0 +1,210 @@
+"""
+Per-stage timing instrumentation for the analysis pipeline.
+
+CPU time is that of the thread running each ``timed`` block, so work done
+elsewhere is not counted: the ffmpeg subprocess behind ``extraction``, and
+torch's intra-op threads behind ``emotion``, whose ``cpu_s`` is low by up
+to a factor of the inference thread count. Use wall time for those stages.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+
+# Upper bounds (seconds) of the per-call latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class StageTotals:
+    """Accumulated cost of one pipeline stage."""
+    
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    bytes: int = 0
+    
+    def add(self, wall_s: float, cpu_s: float, nbytes: int) -> None:
+        self.calls += 1
+        self.wall_s += wall_s
+        self.cpu_s += cpu_s
+        self.bytes += nbytes
+    
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "wall_s": round(self.wall_s, 3),
+            "cpu_s": round(self.cpu_s, 3),
+            "bytes": self.bytes,
+        }
+
+
+class Histogram:
+    """Fixed-bucket histogram of call latencies."""
+    
+    __slots__ = ("bounds", "counts", "sum", "count")
+    
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return ``(le, count)`` pairs, including ``+Inf``, as Prometheus expects."""
+        pairs = []
+        total = 0
+        for bound, count in zip((*map(str, self.bounds), "+Inf"), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class Timings:
+    """
+    Stage totals of a single analysis.
+    
+    Installed for the duration of an analysis with ``collect``; every
+    ``timed`` block in the same context adds to it.
+    """
+    
+    def __init__(self) -> None:
+        self.stages: dict[str, StageTotals] = {}
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+    
+    def record(self, stage: str, wall_s: float, cpu_s: float, nbytes: int) -> None:
+        with self._lock:
+            self.stages.setdefault(stage, StageTotals()).add(wall_s, cpu_s, nbytes)
+    
+    def to_dict(self) -> dict:
+        """Summary with total elapsed time and the totals of each stage."""
+        with self._lock:
+            return {
+                "elapsed_s": round(time.perf_counter() - self._started, 3),
+                "stages": {
+                    stage: totals.to_dict() for stage, totals in self.stages.items()
+                },
+            }
+
+
+class Instrumentation:
+    """
+    Process-wide stage totals and latency histograms.
+    
+    Example:
+        with timed("emotion", nbytes=payload_size):
+            run_inference()
+        print(instrumentation.render_prometheus())
+    """
+    
+    PREFIX = "eduvisor_stage"
+    
+    def __init__(self) -> None:
+        self._totals: dict[str, StageTotals] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, stage: str, wall_s: float, cpu_s: float, nbytes: int) -> None:
+        with self._lock:
+            self._totals.setdefault(stage, StageTotals()).add(wall_s, cpu_s, nbytes)
+            self._histograms.setdefault(stage, Histogram()).observe(wall_s)
+    
+    def render_prometheus(self) -> str:
+        """Render all counters and histograms in the Prometheus text format."""
+        with self._lock:
+            totals = {stage: StageTotals(**vars(t)) for stage, t in self._totals.items()}
+            histograms = {
+                stage: (h.cumulative(), h.sum, h.count)
+                for stage, h in self._histograms.items()
+            }
+        
+        lines = []
+        counters = (
+            ("calls_total", "Calls per analysis stage.", "calls"),
+            ("wall_seconds_total", "Wall-clock time spent per analysis stage.", "wall_s"),
+            ("cpu_seconds_total", "CPU time spent per analysis stage.", "cpu_s"),
+            ("bytes_total", "Bytes processed per analysis stage.", "bytes"),
+        )
+        for name, help_text, field in counters:
+            metric = f"{self.PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for stage, stage_totals in sorted(totals.items()):
+                lines.append(f'{metric}{{stage="{stage}"}} {getattr(stage_totals, field)}')
+        
+        metric = f"{self.PREFIX}_latency_seconds"
+        lines.append(f"# HELP {metric} Latency of individual calls per analysis stage.")
+        lines.append(f"# TYPE {metric} histogram")
+        for stage, (buckets, total, count) in sorted(histograms.items()):
+            for bound, cumulative in buckets:
+                lines.append(f'{metric}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{stage="{stage}"}} {total}')
+            lines.append(f'{metric}_count{{stage="{stage}"}} {count}')
+        
+        return "\n".join(lines) + "\n"
+
+
+class Span:
+    """A running ``timed`` block; set ``bytes`` once the size is known."""
+    
+    __slots__ = ("stage", "bytes")
+    
+    def __init__(self, stage: str, nbytes: int) -> None:
+        self.stage = stage
+        self.bytes = nbytes
+
+
+instrumentation = Instrumentation()
+
+_current_timings: ContextVar[Timings | None] = ContextVar("analysis_timings", default=None)
+
+
+@contextmanager
+def timed(stage: str, nbytes: int = 0, cpu: bool = True) -> Iterator[Span]:
+    """
+    Record the wall time, CPU time and bytes of a block under ``stage``.
+    
+    CPU time is that of the current thread. Pass ``cpu=False`` around
+    ``await`` points, where the thread also runs other tasks.
+    """
+    span = Span(stage, nbytes)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time() if cpu else 0.0
+    try:
+        yield span
+    finally:
+        wall_s = time.perf_counter() - wall_start
+        cpu_s = time.thread_time() - cpu_start if cpu else 0.0
+        instrumentation.record(stage, wall_s, cpu_s, span.bytes)
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.record(stage, wall_s, cpu_s, span.bytes)
+
+
+@contextmanager
+def collect() -> Iterator[Timings]:
+    """
+    Collect the stage totals of the ``timed`` blocks run in this context.
+    
+    Work handed to other threads is only included if it runs in a copy of
+    this context (``contextvars.copy_context().run``, ``asyncio.to_thread``).
+    """
+    timings = Timings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
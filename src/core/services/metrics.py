@@ -4,28 +4,41 @@ Metrics calculation service for lecture analysis.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Sequence
 
+import numpy as np
+
 from .emotion import EmotionResult, ENGAGING_EMOTIONS
+from .instrumentation import timed
+from .utterance_store import UtteranceStore
 
 
-@dataclass
+@dataclass(slots=True)
 class Utterance:
-    """Represents an analyzed audio segment with transcript and emotion."""
+    """
+    Represents an analyzed audio segment with transcript and emotion.
+    
+    Segments without speech are kept to preserve the timeline but carry
+    no transcript or emotion. Word and question counts are computed once
+    when the utterance is created.
+    """
     
     start_time_ms: int
     end_time_ms: int
     transcript: str
-    emotion: EmotionResult
+    emotion: EmotionResult | None
+    is_speech: bool = True
+    word_count: int = field(init=False, repr=False, compare=False)
+    question_count: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.word_count = len(self.transcript.split())
+        self.question_count = self.transcript.count("?")
     
     @property
     def duration_ms(self) -> int:
         return self.end_time_ms - self.start_time_ms
-    
-    @property
-    def word_count(self) -> int:
-        return len(self.transcript.split())
 
 
 @dataclass
@@ -38,6 +51,8 @@ class LectureMetrics:
     question_count: int
     total_duration_ms: int
     utterance_count: int
+    speech_duration_ms: int = 0
+    silent_count: int = 0
     
     def to_dict(self) -> dict:
         return {
@@ -51,74 +66,189 @@ class LectureMetrics:
 class MetricsCalculator:
     """
     Calculates lecture quality metrics from analyzed utterances.
+    
+    Utterances are converted to an UtteranceStore and every metric is
+    computed over its columns. Silent segments are excluded from every
+    metric, so engagement and tone describe only the time the lecturer
+    speaks and words per minute is the speaking rate.
     """
     
-    def calculate(self, utterances: Sequence[Utterance]) -> LectureMetrics:
+    # Bump when a metric formula changes so cached lectures are recomputed.
+    VERSION = "1"
+    
+    @timed("metrics")
+    def calculate(self, utterances: Sequence[Utterance] | UtteranceStore) -> LectureMetrics:
         """Calculate all metrics for a set of utterances."""
-        if not utterances:
+        store = (
+            utterances if isinstance(utterances, UtteranceStore)
+            else UtteranceStore.from_utterances(utterances)
+        )
+        speech = store.is_speech
+        speech_count = int(np.count_nonzero(speech))
+        total_duration_ms = int(store.end_ms[-1]) if len(store) else 0
+        
+        if not speech_count:
             return LectureMetrics(
                 engagement_percentage=0.0,
                 tone_modulation_score=0.0,
                 words_per_minute=0.0,
                 question_count=0,
-                total_duration_ms=0,
-                utterance_count=0,
+                total_duration_ms=total_duration_ms,
+                utterance_count=len(store),
+                silent_count=len(store),
             )
         
+        speech_duration_ms = int(store.duration_ms[speech].sum())
+        
         return LectureMetrics(
-            engagement_percentage=self._calculate_engagement(utterances),
-            tone_modulation_score=self._calculate_tone_modulation(utterances),
-            words_per_minute=self._calculate_wpm(utterances),
-            question_count=self._count_questions(utterances),
-            total_duration_ms=utterances[-1].end_time_ms,
-            utterance_count=len(utterances),
+            engagement_percentage=self._calculate_engagement(store, speech_count),
+            tone_modulation_score=self._calculate_tone_modulation(store),
+            words_per_minute=self._calculate_wpm(store, speech_duration_ms),
+            question_count=self._count_questions(store),
+            total_duration_ms=total_duration_ms,
+            utterance_count=len(store),
+            speech_duration_ms=speech_duration_ms,
+            silent_count=len(store) - speech_count,
         )
     
-    def _calculate_engagement(self, utterances: Sequence[Utterance]) -> float:
-        engaging_count = sum(1 for u in utterances if u.emotion.is_engaging)
-        return round((engaging_count / len(utterances)) * 100, 1)
+    def _calculate_engagement(self, store: UtteranceStore, speech_count: int) -> float:
+        return _engagement(int(np.count_nonzero(store.engaging)), speech_count)
     
-    def _calculate_tone_modulation(self, utterances: Sequence[Utterance]) -> float:
-        emotion_counts: dict[str, int] = {}
-        
+    def _calculate_tone_modulation(self, store: UtteranceStore) -> float:
+        counts = store.emotion_counts()
+        return _tone_modulation({
+            store.labels[i]: int(counts[i]) for i in np.flatnonzero(counts)
+        })
+    
+    def _calculate_wpm(self, store: UtteranceStore, speech_duration_ms: int) -> float:
+        return _wpm(int(store.word_counts[store.is_speech].sum()), speech_duration_ms)
+    
+    def _count_questions(self, store: UtteranceStore) -> int:
+        return _questions(int(store.question_counts[store.is_speech].sum()))
+
+
+class IncrementalMetrics:
+    """
+    Lecture metrics maintained one utterance at a time.
+    
+    ``add`` updates running counters and the emotion histogram in constant
+    time, and ``snapshot`` turns them into LectureMetrics at any point,
+    matching what MetricsCalculator returns for the utterances added so far.
+    
+    Example:
+        running = IncrementalMetrics()
         for utterance in utterances:
-            emotion = utterance.emotion.dominant_emotion
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
-        
-        total_count = sum(emotion_counts.values())
-        num_emotions = len(emotion_counts)
-        
-        if num_emotions == 0:
-            return 0.0
-        
-        ideal_distribution = total_count / num_emotions
+            running.add(utterance)
+            print(running.snapshot().engagement_percentage)
+    """
+    
+    __slots__ = (
+        "utterance_count",
+        "silent_count",
+        "total_duration_ms",
+        "speech_duration_ms",
+        "engaging_count",
+        "word_count",
+        "question_count",
+        "emotion_counts",
+    )
+    
+    def __init__(self) -> None:
+        self.utterance_count = 0
+        self.silent_count = 0
+        self.total_duration_ms = 0
+        self.speech_duration_ms = 0
+        self.engaging_count = 0
+        self.word_count = 0
+        self.question_count = 0
+        self.emotion_counts: dict[str, int] = {}
+    
+    def add(self, utterance: Utterance) -> None:
+        """Account for the next utterance in timeline order."""
+        self.utterance_count += 1
+        self.total_duration_ms = utterance.end_time_ms
         
-        total_difference = sum(
-            abs(count - ideal_distribution)
-            for count in emotion_counts.values()
-        )
-        max_difference = (
-            (total_count - ideal_distribution) +
-            (num_emotions - 1) * ideal_distribution
-        )
+        if not utterance.is_speech:
+            self.silent_count += 1
+            return
         
-        if max_difference == 0:
-            emotion = next(iter(emotion_counts))
-            return 40.0 if emotion in ENGAGING_EMOTIONS else 20.0
+        self.speech_duration_ms += utterance.duration_ms
+        self.word_count += utterance.word_count
+        self.question_count += utterance.question_count
         
-        modulation_score = (total_difference / max_difference) * 100
-        return round(abs(100 - modulation_score), 1)
+        emotion = utterance.emotion
+        if emotion is not None:
+            label = emotion.dominant_emotion
+            self.emotion_counts[label] = self.emotion_counts.get(label, 0) + 1
+            if emotion.is_engaging:
+                self.engaging_count += 1
     
-    def _calculate_wpm(self, utterances: Sequence[Utterance]) -> float:
-        total_words = sum(u.word_count for u in utterances)
-        total_minutes = utterances[-1].end_time_ms / 60000
+    def snapshot(self) -> LectureMetrics:
+        """Return the metrics of the utterances added so far."""
+        speech_count = self.utterance_count - self.silent_count
         
-        if total_minutes == 0:
-            return 0.0
+        if not speech_count:
+            return LectureMetrics(
+                engagement_percentage=0.0,
+                tone_modulation_score=0.0,
+                words_per_minute=0.0,
+                question_count=0,
+                total_duration_ms=self.total_duration_ms,
+                utterance_count=self.utterance_count,
+                silent_count=self.silent_count,
+            )
         
-        return round(total_words / total_minutes, 1)
+        return LectureMetrics(
+            engagement_percentage=_engagement(self.engaging_count, speech_count),
+            tone_modulation_score=_tone_modulation(self.emotion_counts),
+            words_per_minute=_wpm(self.word_count, self.speech_duration_ms),
+            question_count=_questions(self.question_count),
+            total_duration_ms=self.total_duration_ms,
+            utterance_count=self.utterance_count,
+            speech_duration_ms=self.speech_duration_ms,
+            silent_count=self.silent_count,
+        )
+
+
+def _engagement(engaging_count: int, speech_count: int) -> float:
+    return round((engaging_count / speech_count) * 100, 1)
+
+
+def _tone_modulation(emotion_counts: dict[str, int]) -> float:
+    """Score how evenly speech is spread over the emotions that occur."""
+    total_count = sum(emotion_counts.values())
+    num_emotions = len(emotion_counts)
+    
+    if num_emotions == 0:
+        return 0.0
+    
+    ideal_distribution = total_count / num_emotions
+    
+    total_difference = sum(
+        abs(count - ideal_distribution)
+        for count in emotion_counts.values()
+    )
+    max_difference = (
+        (total_count - ideal_distribution) +
+        (num_emotions - 1) * ideal_distribution
+    )
     
-    def _count_questions(self, utterances: Sequence[Utterance]) -> int:
-        count = sum(u.transcript.count("?") for u in utterances)
-        return max(count, 1)
+    if max_difference == 0:
+        emotion = next(iter(emotion_counts))
+        return 40.0 if emotion in ENGAGING_EMOTIONS else 20.0
+    
+    modulation_score = (total_difference / max_difference) * 100
+    return round(abs(100 - modulation_score), 1)
+
+
+def _wpm(word_count: int, speech_duration_ms: int) -> float:
+    total_minutes = speech_duration_ms / 60000
+    
+    if total_minutes == 0:
+        return 0.0
+    
+    return round(word_count / total_minutes, 1)
+
 
+def _questions(count: int) -> int:
+    return max(count, 1)
@@ -0,0 +1,123 @@
+"""
+Process-wide registry for expensive, shareable model objects.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class LoadStats:
+    """Load time and memory footprint recorded for a registry entry."""
+    
+    name: str
+    load_seconds: float
+    parameter_bytes: int
+    rss_delta_bytes: int
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "load_seconds": round(self.load_seconds, 3),
+            "parameter_bytes": self.parameter_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+        }
+
+
+class ModelRegistry:
+    """
+    Thread-safe cache that loads each named object at most once per process.
+    
+    Loads of different entries can proceed in parallel; concurrent requests
+    for the same entry block until the first loader finishes.
+    
+    Example:
+        model = model_registry.get("wav2vec2", lambda: load_model())
+    """
+    
+    def __init__(self) -> None:
+        self._entries: dict[str, Any] = {}
+        self._stats: dict[str, LoadStats] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str, loader: Callable[[], T]) -> T:
+        """Return the entry for ``name``, loading it on first use."""
+        try:
+            return self._entries[name]
+        except KeyError:
+            pass
+        
+        with self._lock:
+            entry_lock = self._locks.setdefault(name, threading.Lock())
+        
+        with entry_lock:
+            if name in self._entries:
+                return self._entries[name]
+            
+            rss_before = _current_rss_bytes()
+            started = time.perf_counter()
+            value = loader()
+            elapsed = time.perf_counter() - started
+            
+            stats = LoadStats(
+                name=name,
+                load_seconds=elapsed,
+                parameter_bytes=_parameter_bytes(value),
+                rss_delta_bytes=max(_current_rss_bytes() - rss_before, 0),
+            )
+            logger.info(
+                "Loaded %s in %.2fs (parameters: %d bytes, rss delta: %d bytes)",
+                name, stats.load_seconds, stats.parameter_bytes, stats.rss_delta_bytes,
+            )
+            
+            self._stats[name] = stats
+            self._entries[name] = value
+            return value
+    
+    def is_loaded(self, name: str) -> bool:
+        """Check whether an entry has already been loaded."""
+        return name in self._entries
+    
+    def stats(self) -> list[LoadStats]:
+        """Load statistics for every entry, in load order."""
+        return list(self._stats.values())
+    
+    def clear(self) -> None:
+        """Drop all entries (useful for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+            self._locks.clear()
+
+
+def _parameter_bytes(value: Any) -> int:
+    """Size of the torch parameters and buffers held by a loaded object."""
+    model = getattr(value, "model", value)
+    if not (hasattr(model, "parameters") and hasattr(model, "buffers")):
+        return 0
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+def _current_rss_bytes() -> int:
+    """Resident set size of this process, or 0 when it cannot be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,119 @@
+"""
+Pause-aligned segmentation of audio into analysis chunks.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class PauseSegmenter:
+    """
+    Chooses chunk boundaries at the quietest point near the target length.
+    
+    Instead of cutting every ``target_ms``, each boundary is placed at the
+    lowest-energy frame within ``tolerance_ms`` of the target, so cuts fall
+    in pauses between words. Chunks are never shorter than ``min_ms`` (except
+    a recording that is shorter as a whole) or longer than ``max_ms``, and
+    the final chunk always extends to the end of the recording.
+    
+    Example:
+        segmenter = PauseSegmenter(target_ms=30000)
+        cut = segmenter.next_cut(samples, sample_rate=16000)
+        first_chunk = samples[:cut]
+    """
+    
+    # Bump when a change moves chunk boundaries for the same audio.
+    VERSION = "1"
+    
+    def __init__(
+        self,
+        target_ms: int = 30000,
+        tolerance_ms: int = 5000,
+        min_ms: int = 10000,
+        max_ms: int = 55000,
+        frame_ms: int = 20,
+    ) -> None:
+        """
+        Initialize the segmenter.
+        
+        Args:
+            target_ms: Preferred chunk length.
+            tolerance_ms: How far a cut may move from the target to find a pause.
+            min_ms: Shortest allowed chunk.
+            max_ms: Longest allowed chunk (synchronous Speech requests
+                accept at most 60 seconds of audio).
+            frame_ms: Frame length for the energy measurement.
+        """
+        if not min_ms <= target_ms <= max_ms:
+            raise ValueError("Segment lengths must satisfy min_ms <= target_ms <= max_ms")
+        
+        self.target_ms = target_ms
+        self.tolerance_ms = tolerance_ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.frame_ms = frame_ms
+    
+    def lookahead_frames(self, sample_rate: int) -> int:
+        """
+        Audio frames ``next_cut`` needs to see before the end of the recording.
+        
+        With this much buffered audio the chosen cut never leaves a
+        remainder shorter than ``min_ms``.
+        """
+        return (self.max_ms + self.min_ms) * sample_rate // 1000
+    
+    def next_cut(self, samples: np.ndarray, sample_rate: int) -> int:
+        """
+        Return the frame index at which the chunk starting at ``samples[0]`` ends.
+        
+        Args:
+            samples: PCM samples shaped ``(frames,)`` or ``(frames, channels)``.
+                Unless they run to the end of the recording, they must hold
+                at least ``lookahead_frames`` frames.
+            sample_rate: Sample rate of ``samples``.
+        """
+        total = len(samples)
+        if total * 1000 <= self.max_ms * sample_rate:
+            return total
+        
+        frame_length = max(sample_rate * self.frame_ms // 1000, 1)
+        
+        def to_frame(ms: int) -> int:
+            return ms * sample_rate // 1000 // frame_length
+        
+        target = to_frame(self.target_ms)
+        lo = max(to_frame(self.target_ms - self.tolerance_ms), to_frame(self.min_ms))
+        hi = min(
+            to_frame(self.target_ms + self.tolerance_ms),
+            to_frame(self.max_ms),
+            (total - self.min_ms * sample_rate // 1000) // frame_length,
+        )
+        if hi <= lo:
+            return max(min(target, hi), 1) * frame_length
+        
+        rms = self.frame_rms(samples[lo * frame_length:hi * frame_length], frame_length)
+        
+        # Break ties between equally quiet frames in favour of the target.
+        distance = np.abs(np.arange(lo, hi) - target) / max(hi - lo, 1)
+        best = lo + int(np.argmin(rms + distance * 1e-6))
+        return best * frame_length + frame_length // 2
+    
+    def boundaries(self, samples: np.ndarray, sample_rate: int) -> list[tuple[int, int]]:
+        """Return ``(start, end)`` frame ranges covering a whole recording."""
+        ranges: list[tuple[int, int]] = []
+        start = 0
+        while start < len(samples):
+            end = start + self.next_cut(samples[start:], sample_rate)
+            ranges.append((start, end))
+            start = end
+        return ranges
+    
+    @staticmethod
+    def frame_rms(samples: np.ndarray, frame_length: int) -> np.ndarray:
+        """Return the RMS level of consecutive frames of a PCM buffer."""
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1, dtype=np.float32)
+        frame_count = len(samples) // frame_length
+        frames = samples[:frame_count * frame_length].reshape(frame_count, frame_length)
+        return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
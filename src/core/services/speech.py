@@ -4,60 +4,235 @@ Speech-to-text transcription service using Google Cloud Speech API.
 
 from __future__ import annotations
 
+import asyncio
+import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 
 from google.cloud import speech
+from imageio_ffmpeg import get_ffmpeg_exe
 
+from .audio import AudioChunk
 from .config import Config
+from .features import AudioFeatures, decode_chunk
+from .instrumentation import timed
+from .speech_client import TranscriptionClient
+
+
+AudioEncoding = speech.RecognitionConfig.AudioEncoding
+
+
+@dataclass
+class SpeechPayload:
+    """Audio content and the format description the Speech API needs for it."""
+    
+    content: bytes
+    encoding: AudioEncoding
+    sample_rate: int
+    channels: int
+
+
+def prepare_payload(
+    chunk: AudioChunk,
+    sample_rate: int = 16000,
+    encoding: str = "LINEAR16",
+) -> SpeechPayload:
+    """
+    Shrink an in-memory chunk to the smallest payload speech recognition needs.
+    
+    The chunk is downmixed to mono, resampled to ``sample_rate`` and
+    optionally compressed losslessly to FLAC.
+    
+    Args:
+        chunk: In-memory audio chunk.
+        sample_rate: Target sample rate (16 kHz is optimal for speech).
+        encoding: "LINEAR16" for raw PCM or "FLAC" for compressed audio.
+    """
+    return encode_payload(decode_chunk(chunk, sample_rate), encoding)
+
+
+def encode_payload(features: AudioFeatures, encoding: str = "LINEAR16") -> SpeechPayload:
+    """Encode an already decoded mono waveform as a Speech payload."""
+    pcm = features.to_pcm16()
+    
+    if encoding == "FLAC":
+        return SpeechPayload(
+            content=_encode_flac(pcm, features.sample_rate),
+            encoding=AudioEncoding.FLAC,
+            sample_rate=features.sample_rate,
+            channels=1,
+        )
+    
+    return SpeechPayload(
+        content=pcm,
+        encoding=AudioEncoding.LINEAR16,
+        sample_rate=features.sample_rate,
+        channels=1,
+    )
+
+
+def _encode_flac(pcm: bytes, sample_rate: int) -> bytes:
+    """Encode mono 16-bit PCM to FLAC through an ffmpeg pipe."""
+    result = subprocess.run(
+        [
+            get_ffmpeg_exe(),
+            "-nostdin",
+            "-loglevel", "error",
+            "-f", "s16le",
+            "-ar", str(sample_rate),
+            "-ac", "1",
+            "-i", "pipe:0",
+            "-f", "flac",
+            "pipe:1",
+        ],
+        input=pcm,
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"FLAC encoding failed: {result.stderr.decode(errors='replace').strip()}")
+    return result.stdout
 
 
 class SpeechTranscriber:
     """
     Transcribes audio files to text using Google Cloud Speech-to-Text.
+    
+    In-memory chunks are converted with ``prepare_payload`` before upload,
+    so requests carry 16 kHz mono audio regardless of the source format.
+    Pre-decoded AudioFeatures are encoded as-is without decoding again.
+    Requests go through the process-wide TranscriptionClient, which applies
+    the quota, concurrency limit, deadline and retry policy.
     """
     
+    # Bump when a change alters transcripts for the same audio.
+    VERSION = "1"
+    
     def __init__(
         self,
         config: Config | None = None,
         sample_rate: int = 44100,
         channel_count: int = 2,
+        client: speech.SpeechClient | None = None,
     ) -> None:
-        """Initialize the transcriber with Google Cloud credentials."""
+        """
+        Initialize the transcriber with Google Cloud credentials.
+        
+        Args:
+            config: Service configuration.
+            sample_rate: Sample rate of audio files passed by path.
+            channel_count: Channel count of audio files passed by path.
+            client: Pre-built Speech client (e.g. bound to a fake server)
+                used instead of the shared one.
+        """
         self.config = config or Config.load()
         self.sample_rate = sample_rate
         self.channel_count = channel_count
-        self._client: speech.SpeechClient | None = None
+        self.payload_sample_rate = self.config.speech_sample_rate
+        self.payload_encoding = self.config.speech_encoding
+        self._transcription_client: TranscriptionClient | None = None
+        if client is not None:
+            self._transcription_client = TranscriptionClient.from_config(self.config, client)
+    
+    @property
+    def transcription_client(self) -> TranscriptionClient:
+        """Lazy-load the shared, rate-limited transcription client."""
+        if self._transcription_client is None:
+            self._transcription_client = TranscriptionClient.shared(self.config)
+        return self._transcription_client
     
     @property
     def client(self) -> speech.SpeechClient:
-        """Lazy-load the Speech client."""
-        if self._client is None:
-            self._client = speech.SpeechClient.from_service_account_json(
-                self.config.google_cloud_key_path
+        """The underlying Speech client."""
+        return self.transcription_client.speech_client
+    
+    @property
+    def cache_version(self) -> str:
+        """Identifies the code version and payload format behind a transcript."""
+        return f"{self.VERSION}/{self.payload_sample_rate}/{self.payload_encoding}"
+    
+    def transcribe(self, audio: Path | AudioChunk | AudioFeatures) -> str:
+        """Transcribe an audio file, audio chunk or decoded waveform to text."""
+        with timed("transcription") as span:
+            payload = self.prepare(audio)
+            span.bytes = len(payload.content)
+            recognition_config, recognition_audio = self._request(payload)
+            
+            response = self.transcription_client.recognize(
+                config=recognition_config,
+                audio=recognition_audio,
             )
-        return self._client
+            return self._join(response)
     
-    def transcribe(self, audio_path: Path) -> str:
-        """Transcribe an audio file to text."""
-        with open(audio_path, "rb") as f:
-            audio_content = f.read()
+    async def transcribe_async(self, audio: Path | AudioChunk | AudioFeatures) -> str:
+        """
+        Transcribe without blocking the event loop.
         
-        audio = speech.RecognitionAudio(content=audio_content)
+        The payload is encoded in a worker thread and the request is awaited
+        on the async Speech client.
+        """
+        with timed("transcription", cpu=False) as span:
+            payload = await asyncio.to_thread(self.prepare, audio)
+            span.bytes = len(payload.content)
+            recognition_config, recognition_audio = self._request(payload)
+            
+            response = await self.transcription_client.recognize_async(
+                config=recognition_config,
+                audio=recognition_audio,
+            )
+            return self._join(response)
+    
+    @staticmethod
+    def _request(
+        payload: SpeechPayload,
+    ) -> tuple[speech.RecognitionConfig, speech.RecognitionAudio]:
+        recognition_audio = speech.RecognitionAudio(content=payload.content)
         
         recognition_config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            encoding=payload.encoding,
             language_code="en-US",
-            sample_rate_hertz=self.sample_rate,
-            audio_channel_count=self.channel_count,
+            sample_rate_hertz=payload.sample_rate,
+            audio_channel_count=payload.channels,
             enable_automatic_punctuation=True,
         )
-        
-        response = self.client.recognize(config=recognition_config, audio=audio)
-        
+        return recognition_config, recognition_audio
+    
+    @staticmethod
+    def _join(response: speech.RecognizeResponse) -> str:
         transcripts = []
         for result in response.results:
             if result.alternatives:
                 transcripts.append(result.alternatives[0].transcript)
         
         return " ".join(transcripts)
-
+    
+    def prepare(self, audio: Path | AudioChunk | AudioFeatures) -> SpeechPayload:
+        """Build the request payload for an audio file, chunk or decoded waveform."""
+        if isinstance(audio, AudioFeatures):
+            return encode_payload(
+                audio.resample(self.payload_sample_rate), self.payload_encoding
+            )
+        
+        if isinstance(audio, AudioChunk) and audio.in_memory:
+            return prepare_payload(
+                audio,
+                sample_rate=self.payload_sample_rate,
+                encoding=self.payload_encoding,
+            )
+        
+        sample_rate = self.sample_rate
+        channel_count = self.channel_count
+        if isinstance(audio, AudioChunk):
+            sample_rate = audio.sample_rate
+            channel_count = audio.channels
+        
+        path = audio.file_path if isinstance(audio, AudioChunk) else audio
+        with open(path, "rb") as f:
+            content = f.read()
+        
+        return SpeechPayload(
+            content=content,
+            encoding=AudioEncoding.LINEAR16,
+            sample_rate=sample_rate,
+            channels=channel_count,
+        )
@@ -0,0 +1,278 @@
+"""
+Shared, rate-limited and retrying client for the Google Cloud Speech API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from google.api_core import exceptions
+from google.cloud import speech
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from .config import Config
+from .registry import model_registry
+
+
+logger = logging.getLogger(__name__)
+
+# Recognize is idempotent, so these transient failures are safe to retry.
+RETRYABLE_ERRORS = (
+    exceptions.ResourceExhausted,
+    exceptions.ServiceUnavailable,
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.Aborted,
+)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the average request rate.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``,
+    which allows short bursts while bounding the sustained rate.
+    A non-positive rate disables limiting.
+    """
+    
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` are available, then consume them."""
+        while (wait := self._take(tokens)) > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Wait without blocking the event loop until ``tokens`` are consumed."""
+        while (wait := self._take(tokens)) > 0:
+            await asyncio.sleep(wait)
+    
+    def _take(self, tokens: float) -> float:
+        """Consume ``tokens`` if available; otherwise return seconds to wait."""
+        if self.rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            
+            return (tokens - self._tokens) / self.rate
+
+
+@dataclass
+class ClientStats:
+    """Counters describing a client's traffic since it was created."""
+    
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+        }
+
+
+class TranscriptionClient:
+    """
+    Front end for ``Speech.Recognize`` shared by every analysis in a process.
+    
+    All calls go through one Speech client, and therefore one multiplexed
+    gRPC channel. A token bucket enforces the request quota, a semaphore
+    bounds concurrent in-flight requests, every attempt has a deadline, and
+    transient errors are retried with jittered exponential backoff.
+    
+    ``recognize_async`` applies the same policy on an asyncio event loop
+    through a SpeechAsyncClient created on first use. The quota is shared
+    with synchronous calls; in-flight async requests are bounded by their
+    own ``max_concurrency`` semaphore.
+    
+    Example:
+        client = TranscriptionClient.shared()
+        response = client.recognize(config=recognition_config, audio=audio)
+    """
+    
+    def __init__(
+        self,
+        speech_client: speech.SpeechClient,
+        requests_per_second: float = 10.0,
+        max_concurrency: int = 8,
+        timeout_s: float = 60.0,
+        max_attempts: int = 5,
+        key_path: str | None = None,
+    ) -> None:
+        """
+        Initialize the client.
+        
+        Args:
+            speech_client: Underlying Speech client (and its gRPC channel).
+            requests_per_second: Sustained request quota (0 disables it).
+            max_concurrency: Maximum requests in flight at once.
+            timeout_s: Deadline for each attempt.
+            max_attempts: Attempts per request, including the first.
+            key_path: Service account key for the async client. Without
+                it, async calls run the synchronous client in a thread.
+        """
+        self.speech_client = speech_client
+        self.key_path = key_path
+        self.max_concurrency = max_concurrency
+        self.timeout_s = timeout_s
+        self.max_attempts = max_attempts
+        self.stats = ClientStats()
+        
+        self._bucket = TokenBucket(requests_per_second)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._stats_lock = threading.Lock()
+        self._async_client: speech.SpeechAsyncClient | None = None
+        self._async_slots: asyncio.Semaphore | None = None
+    
+    @classmethod
+    def from_config(
+        cls,
+        config: Config,
+        speech_client: speech.SpeechClient | None = None,
+    ) -> TranscriptionClient:
+        """Build a client using the limits configured in ``config``."""
+        return cls(
+            speech_client or speech.SpeechClient.from_service_account_json(
+                config.google_cloud_key_path
+            ),
+            requests_per_second=config.speech_requests_per_second,
+            max_concurrency=config.speech_max_concurrency,
+            timeout_s=config.speech_timeout_s,
+            max_attempts=config.speech_max_attempts,
+            key_path=None if speech_client else config.google_cloud_key_path,
+        )
+    
+    @classmethod
+    def shared(cls, config: Config | None = None) -> TranscriptionClient:
+        """Return the process-wide client, creating it on first use."""
+        config = config or Config.load()
+        return model_registry.get(
+            f"speech-client:{config.google_cloud_key_path}",
+            lambda: cls.from_config(config),
+        )
+    
+    def recognize(
+        self,
+        config: speech.RecognitionConfig,
+        audio: speech.RecognitionAudio,
+    ) -> speech.RecognizeResponse:
+        """Run a recognition request under the quota, concurrency and retry policy."""
+        retrying = Retrying(
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            wait=wait_random_exponential(multiplier=0.5, max=30),
+            stop=stop_after_attempt(self.max_attempts),
+            before_sleep=self._record_retry,
+            reraise=True,
+        )
+        
+        try:
+            for attempt in retrying:
+                with attempt:
+                    return self._attempt(config, audio)
+        except Exception:
+            self._count("failures")
+            raise
+    
+    async def recognize_async(
+        self,
+        config: speech.RecognitionConfig,
+        audio: speech.RecognitionAudio,
+    ) -> speech.RecognizeResponse:
+        """
+        Await a recognition request under the same quota and retry policy.
+        
+        Must always be called from the same event loop, which the async
+        gRPC channel is bound to.
+        """
+        if self.key_path is None:
+            return await asyncio.to_thread(self.recognize, config, audio)
+        
+        retrying = AsyncRetrying(
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            wait=wait_random_exponential(multiplier=0.5, max=30),
+            stop=stop_after_attempt(self.max_attempts),
+            before_sleep=self._record_retry,
+            reraise=True,
+        )
+        
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    return await self._attempt_async(config, audio)
+        except Exception:
+            self._count("failures")
+            raise
+    
+    def _attempt(
+        self,
+        config: speech.RecognitionConfig,
+        audio: speech.RecognitionAudio,
+    ) -> speech.RecognizeResponse:
+        self._bucket.acquire()
+        with self._slots:
+            self._count("requests")
+            return self.speech_client.recognize(
+                config=config,
+                audio=audio,
+                retry=None,
+                timeout=self.timeout_s,
+            )
+    
+    async def _attempt_async(
+        self,
+        config: speech.RecognitionConfig,
+        audio: speech.RecognitionAudio,
+    ) -> speech.RecognizeResponse:
+        if self._async_client is None:
+            self._async_client = speech.SpeechAsyncClient.from_service_account_json(
+                self.key_path
+            )
+            self._async_slots = asyncio.Semaphore(self.max_concurrency)
+        
+        await self._bucket.acquire_async()
+        async with self._async_slots:
+            self._count("requests")
+            return await self._async_client.recognize(
+                config=config,
+                audio=audio,
+                retry=None,
+                timeout=self.timeout_s,
+            )
+    
+    def _record_retry(self, retry_state) -> None:
+        self._count("retries")
+        logger.warning(
+            "Speech request failed (attempt %d), retrying: %s",
+            retry_state.attempt_number,
+            retry_state.outcome.exception(),
+        )
+    
+    def _count(self, field: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
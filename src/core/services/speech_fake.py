@@ -0,0 +1,181 @@
+"""
+In-process fake of the Google Cloud Speech API for offline measurement.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import grpc
+from google.cloud import speech
+from google.cloud.speech_v1.services.speech.transports import SpeechGrpcTransport
+
+
+MAX_MESSAGE_BYTES = 32 * 1024 * 1024
+
+
+@dataclass
+class RecognizeCall:
+    """A request received by the fake server."""
+    
+    payload_bytes: int
+    encoding: str
+    sample_rate: int
+    channels: int
+    seconds: float
+    failed: bool = False
+
+
+class FakeSpeechServer:
+    """
+    gRPC server that implements ``Speech.Recognize`` with canned results.
+    
+    Latency is modelled as a fixed round trip plus upload time at a
+    configurable bandwidth, so payload size differences show up in wall
+    time the way they do against the real service. A fraction of requests
+    can be failed with a chosen status code to exercise retry handling.
+    
+    Example:
+        with FakeSpeechServer(bandwidth_bytes_per_s=2_500_000) as server:
+            transcriber = SpeechTranscriber(client=server.client())
+            transcriber.transcribe(chunk)
+            print(server.calls[0].payload_bytes)
+    """
+    
+    SERVICE_NAME = "google.cloud.speech.v1.Speech"
+    
+    def __init__(
+        self,
+        transcript: str = "this is a fake transcript",
+        base_latency_s: float = 0.05,
+        bandwidth_bytes_per_s: float | None = 2_500_000,
+        max_workers: int = 16,
+        failure_rate: float = 0.0,
+        failure_code: grpc.StatusCode = grpc.StatusCode.RESOURCE_EXHAUSTED,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the fake server.
+        
+        Args:
+            transcript: Text returned for every request.
+            base_latency_s: Fixed per-request latency.
+            bandwidth_bytes_per_s: Simulated upload bandwidth (None disables it).
+            max_workers: Server threads handling requests concurrently.
+            failure_rate: Fraction of requests answered with ``failure_code``.
+            failure_code: gRPC status used for injected failures.
+            seed: Seed for the failure injection random generator.
+        """
+        self.transcript = transcript
+        self.base_latency_s = base_latency_s
+        self.bandwidth_bytes_per_s = bandwidth_bytes_per_s
+        self.max_workers = max_workers
+        self.failure_rate = failure_rate
+        self.failure_code = failure_code
+        self.calls: list[RecognizeCall] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: grpc.Server | None = None
+        self.address = ""
+    
+    def start(self) -> FakeSpeechServer:
+        """Start serving on a free localhost port."""
+        options = [
+            ("grpc.max_receive_message_length", MAX_MESSAGE_BYTES),
+            ("grpc.max_send_message_length", MAX_MESSAGE_BYTES),
+        ]
+        self._server = grpc.server(
+            ThreadPoolExecutor(max_workers=self.max_workers),
+            options=options,
+        )
+        handler = grpc.method_handlers_generic_handler(self.SERVICE_NAME, {
+            "Recognize": grpc.unary_unary_rpc_method_handler(
+                self._recognize,
+                request_deserializer=speech.RecognizeRequest.deserialize,
+                response_serializer=speech.RecognizeResponse.serialize,
+            ),
+        })
+        self._server.add_generic_rpc_handlers((handler,))
+        port = self._server.add_insecure_port("127.0.0.1:0")
+        self._server.start()
+        self.address = f"127.0.0.1:{port}"
+        return self
+    
+    def stop(self) -> None:
+        """Stop the server and drop in-flight requests."""
+        if self._server is not None:
+            self._server.stop(grace=None)
+            self._server = None
+    
+    def client(self) -> speech.SpeechClient:
+        """Build a Speech client connected to this server."""
+        channel = grpc.insecure_channel(self.address, options=[
+            ("grpc.max_send_message_length", MAX_MESSAGE_BYTES),
+            ("grpc.max_receive_message_length", MAX_MESSAGE_BYTES),
+        ])
+        return speech.SpeechClient(transport=SpeechGrpcTransport(channel=channel))
+    
+    def reset(self) -> None:
+        """Forget recorded calls."""
+        with self._lock:
+            self.calls.clear()
+            self.max_in_flight = 0
+    
+    @property
+    def total_payload_bytes(self) -> int:
+        return sum(call.payload_bytes for call in self.calls if not call.failed)
+    
+    @property
+    def failure_count(self) -> int:
+        return sum(1 for call in self.calls if call.failed)
+    
+    def _simulated_latency(self, payload_bytes: int) -> float:
+        latency = self.base_latency_s
+        if self.bandwidth_bytes_per_s:
+            latency += payload_bytes / self.bandwidth_bytes_per_s
+        return latency
+    
+    def _recognize(self, request: speech.RecognizeRequest, context) -> speech.RecognizeResponse:
+        started = time.perf_counter()
+        payload_bytes = len(request.audio.content)
+        
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            failed = self._random.random() < self.failure_rate
+        
+        try:
+            time.sleep(self._simulated_latency(payload_bytes))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.calls.append(RecognizeCall(
+                    payload_bytes=payload_bytes,
+                    encoding=request.config.encoding.name,
+                    sample_rate=request.config.sample_rate_hertz,
+                    channels=request.config.audio_channel_count,
+                    seconds=time.perf_counter() - started,
+                    failed=failed,
+                ))
+        
+        if failed:
+            context.abort(self.failure_code, "Injected failure")
+        
+        alternative = speech.SpeechRecognitionAlternative(
+            transcript=self.transcript, confidence=0.9
+        )
+        return speech.RecognizeResponse(
+            results=[speech.SpeechRecognitionResult(alternatives=[alternative])]
+        )
+    
+    def __enter__(self) -> FakeSpeechServer:
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
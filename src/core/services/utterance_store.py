@@ -0,0 +1,227 @@
+"""
+Columnar storage of analyzed utterances with vectorized timeline metrics.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence, get_args
+
+import numpy as np
+
+from .emotion import ENGAGING_EMOTIONS, EmotionLabel
+
+if TYPE_CHECKING:
+    from .metrics import Utterance
+
+
+EMOTION_LABELS: tuple[str, ...] = get_args(EmotionLabel)
+
+# Emotion code of segments without speech.
+NO_EMOTION = -1
+
+
+class UtteranceStore:
+    """
+    Utterances held as parallel NumPy columns.
+    
+    Row ``i`` describes the ``i``-th utterance in timeline order. Emotions
+    are stored as integer codes into ``labels`` plus a score matrix with one
+    column per label, so metrics over thousands of fine-grained segments
+    are computed with array operations instead of Python loops.
+    
+    Example:
+        store = UtteranceStore.from_utterances(result.utterances)
+        minutes, wpm = store.words_per_minute()
+    """
+    
+    __slots__ = (
+        "labels",
+        "start_ms",
+        "end_ms",
+        "word_counts",
+        "question_counts",
+        "is_speech",
+        "emotion_codes",
+        "scores",
+    )
+    
+    def __init__(
+        self,
+        labels: Sequence[str],
+        start_ms: np.ndarray,
+        end_ms: np.ndarray,
+        word_counts: np.ndarray,
+        question_counts: np.ndarray,
+        is_speech: np.ndarray,
+        emotion_codes: np.ndarray,
+        scores: np.ndarray,
+    ) -> None:
+        self.labels = tuple(labels)
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.word_counts = word_counts
+        self.question_counts = question_counts
+        self.is_speech = is_speech
+        self.emotion_codes = emotion_codes
+        self.scores = scores
+    
+    @classmethod
+    def from_utterances(cls, utterances: Sequence[Utterance]) -> UtteranceStore:
+        """Build the columns from utterances in timeline order."""
+        emotions = [utterance.emotion for utterance in utterances]
+        return cls.from_columns(
+            start_ms=[u.start_time_ms for u in utterances],
+            end_ms=[u.end_time_ms for u in utterances],
+            word_counts=[u.word_count for u in utterances],
+            question_counts=[u.question_count for u in utterances],
+            is_speech=[u.is_speech for u in utterances],
+            emotions=[e.dominant_emotion if e else None for e in emotions],
+            scores=[e.raw_scores if e else None for e in emotions],
+        )
+    
+    @classmethod
+    def from_columns(
+        cls,
+        start_ms: Sequence[int],
+        end_ms: Sequence[int],
+        word_counts: Sequence[int],
+        question_counts: Sequence[int],
+        is_speech: Sequence[bool],
+        emotions: Sequence[str | None],
+        scores: Sequence[dict[str, float] | None],
+    ) -> UtteranceStore:
+        """
+        Build the store from per-utterance values in timeline order.
+        
+        ``emotions`` holds the dominant label of each utterance and
+        ``scores`` its raw score per label; both are empty for utterances
+        without an emotion.
+        """
+        labels = list(EMOTION_LABELS)
+        codes = {label: i for i, label in enumerate(labels)}
+        for emotion, row in zip(emotions, scores):
+            for label in (emotion, *(row or ())):
+                if label and label not in codes:
+                    codes[label] = len(labels)
+                    labels.append(label)
+        
+        count = len(start_ms)
+        emotion_codes = np.full(count, NO_EMOTION, dtype=np.int16)
+        score_matrix = np.zeros((count, len(labels)), dtype=np.float32)
+        
+        for i, (emotion, row) in enumerate(zip(emotions, scores)):
+            if not emotion:
+                continue
+            emotion_codes[i] = codes[emotion]
+            for label, score in (row or {}).items():
+                score_matrix[i, codes[label]] = score
+        
+        return cls(
+            labels=labels,
+            start_ms=np.asarray(start_ms, dtype=np.int64).reshape(count),
+            end_ms=np.asarray(end_ms, dtype=np.int64).reshape(count),
+            word_counts=np.asarray(word_counts, dtype=np.int32).reshape(count),
+            question_counts=np.asarray(question_counts, dtype=np.int32).reshape(count),
+            is_speech=np.asarray(is_speech, dtype=bool).reshape(count),
+            emotion_codes=emotion_codes,
+            scores=score_matrix,
+        )
+    
+    def __len__(self) -> int:
+        return len(self.start_ms)
+    
+    @property
+    def duration_ms(self) -> np.ndarray:
+        return self.end_ms - self.start_ms
+    
+    @property
+    def engaging(self) -> np.ndarray:
+        """Mask of speech segments whose dominant emotion is engaging."""
+        engaging_codes = [
+            i for i, label in enumerate(self.labels) if label in ENGAGING_EMOTIONS
+        ]
+        return self.is_speech & np.isin(self.emotion_codes, engaging_codes)
+    
+    def emotion_counts(self) -> np.ndarray:
+        """Number of speech segments per dominant emotion, indexed like ``labels``."""
+        codes = self.emotion_codes[self.is_speech]
+        return np.bincount(codes[codes >= 0], minlength=len(self.labels))
+    
+    def words_per_minute(self, bin_ms: int = 60000) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Words spoken in each ``bin_ms`` window, scaled to words per minute.
+        
+        Words are spread evenly over their segment, so segments crossing a
+        bin edge contribute to both bins. The last bin may be shorter than
+        ``bin_ms`` and is scaled by its own length.
+        
+        Returns:
+            Bin start times in minutes and the speaking rate in each bin.
+        """
+        edges = self._bin_edges(bin_ms)
+        words = np.diff(self.cumulative(self.word_counts.astype(np.float64), edges))
+        minutes = np.diff(edges) / 60000
+        return edges[:-1] / 60000, words / np.maximum(minutes, 1e-9)
+    
+    def rolling_engagement(
+        self,
+        window_ms: int = 300000,
+        step_ms: int = 60000,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Percentage of speaking time that is engaging over a trailing window.
+        
+        Returns:
+            Window end times in minutes and the engagement percentage of
+            each window (NaN where the window contains no speech).
+        """
+        if not len(self):
+            return np.empty(0), np.empty(0)
+        
+        ends = self._bin_edges(step_ms)[1:]
+        starts = np.maximum(ends - window_ms, self.start_ms[0])
+        speech_ms = self.duration_ms * self.is_speech
+        engaging_ms = self.duration_ms * self.engaging
+        
+        spoken = self.cumulative(speech_ms, ends) - self.cumulative(speech_ms, starts)
+        engaged = self.cumulative(engaging_ms, ends) - self.cumulative(engaging_ms, starts)
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percentage = np.where(spoken > 0, engaged / spoken * 100, np.nan)
+        return ends / 60000, percentage
+    
+    def emotion_transitions(self) -> np.ndarray:
+        """
+        Count changes of dominant emotion between consecutive speech segments.
+        
+        Returns:
+            A ``(labels, labels)`` matrix where entry ``[a, b]`` counts
+            segments with emotion ``a`` followed by one with emotion ``b``.
+        """
+        codes = self.emotion_codes[self.is_speech & (self.emotion_codes >= 0)]
+        matrix = np.zeros((len(self.labels), len(self.labels)), dtype=np.int32)
+        if len(codes) > 1:
+            np.add.at(matrix, (codes[:-1], codes[1:]), 1)
+        return matrix
+    
+    def _bin_edges(self, bin_ms: int) -> np.ndarray:
+        if not len(self):
+            return np.zeros(1, dtype=np.int64)
+        end = int(self.end_ms[-1])
+        return np.append(np.arange(0, end, bin_ms, dtype=np.int64), end)
+    
+    def cumulative(self, amounts: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the running total of ``amounts`` at ``times``.
+        
+        Each segment's amount accrues linearly between its start and end, so
+        the running total is piecewise linear and ``np.interp`` evaluates it
+        for all query times at once.
+        """
+        if not len(self):
+            return np.zeros(len(times))
+        
+        before = np.concatenate(([0], np.cumsum(amounts)[:-1]))
+        points = np.column_stack((self.start_ms, self.end_ms)).ravel()
+        totals = np.column_stack((before, before + amounts)).ravel()
+        return np.interp(times, points, totals)
@@ -6,79 +6,109 @@ from __future__ import annotations
 
 from typing import Sequence
 
-import plotly.graph_objects as go
+import numpy as np
 
+from .instrumentation import timed
 from .metrics import Utterance
+from .utterance_store import UtteranceStore
+
+
+# Segment states stored in timeline runs.
+NON_ENGAGING = 0
+ENGAGING = 1
+SILENT = 2
 
 
 class ChartGenerator:
     """
-    Generates interactive visualizations for lecture analysis.
+    Generates compact chart data for lecture analysis.
+    
+    Charts are stored and sent as small JSON documents and drawn in the
+    browser by ``static/js/timeline.js`` with a shared copy of plotly.js.
     """
     
     ENGAGING_COLOR = "green"
     NON_ENGAGING_COLOR = "red"
+    SILENT_COLOR = "lightgray"
     
-    def create_engagement_timeline(self, utterances: Sequence[Utterance]) -> str:
-        """Create an engagement timeline chart."""
-        if not utterances:
-            return ""
-        
-        engaging_periods: list[tuple[float, float]] = []
-        non_engaging_periods: list[tuple[float, float]] = []
-        
-        for utterance in utterances:
-            start_min = utterance.start_time_ms / 60000
-            end_min = utterance.end_time_ms / 60000
-            
-            if utterance.emotion.is_engaging:
-                engaging_periods.append((start_min, end_min))
-            else:
-                non_engaging_periods.append((start_min, end_min))
+    # Upper bound on runs stored per timeline; longer ones are downsampled.
+    MAX_RUNS = 400
+    
+    @timed("chart")
+    def create_engagement_timeline(
+        self,
+        utterances: Sequence[Utterance] | UtteranceStore,
+        max_runs: int | None = None,
+    ) -> dict:
+        """
+        Build the engagement timeline as run-length encoded JSON data.
         
-        min_time = utterances[0].start_time_ms / 60000
-        max_time = utterances[-1].end_time_ms / 60000
+        Consecutive segments in the same state are merged into one run.
+        If more than ``max_runs`` runs remain, the timeline is divided into
+        ``max_runs`` equal buckets, each taking the state that covers most
+        of it, and merged again.
         
-        fig = go.Figure()
+        Returns:
+            ``{"start": min, "end": min, "runs": [[start, end, state], ...]}``
+            with times in minutes and states NON_ENGAGING, ENGAGING or
+            SILENT, or an empty dict when there are no utterances.
+        """
+        store = (
+            utterances if isinstance(utterances, UtteranceStore)
+            else UtteranceStore.from_utterances(utterances)
+        )
+        if not len(store):
+            return {}
         
-        for start, end in non_engaging_periods:
-            fig.add_shape(
-                type="rect",
-                x0=start, x1=end, y0=4, y1=16,
-                line=dict(color=self.NON_ENGAGING_COLOR),
-                fillcolor=self.NON_ENGAGING_COLOR,
-            )
+        max_runs = max_runs or self.MAX_RUNS
+        states = np.where(
+            ~store.is_speech, SILENT, np.where(store.engaging, ENGAGING, NON_ENGAGING)
+        )
         
-        for start, end in engaging_periods:
-            fig.add_shape(
-                type="rect",
-                x0=start, x1=end, y0=4, y1=16,
-                line=dict(color=self.ENGAGING_COLOR),
-                fillcolor=self.ENGAGING_COLOR,
+        starts, ends, run_states = self._merge_runs(store.start_ms, store.end_ms, states)
+        if len(run_states) > max_runs:
+            starts, ends, run_states = self._merge_runs(
+                *self._downsample(store, states, max_runs)
             )
         
-        # Legend traces
-        fig.add_trace(go.Scatter(
-            x=[None], y=[None], mode="markers",
-            marker=dict(size=10, color=self.ENGAGING_COLOR),
-            name="Engaging", showlegend=True,
-        ))
-        fig.add_trace(go.Scatter(
-            x=[None], y=[None], mode="markers",
-            marker=dict(size=10, color=self.NON_ENGAGING_COLOR),
-            name="Non-Engaging", showlegend=True,
-        ))
+        return {
+            "start": round(float(store.start_ms[0]) / 60000, 3),
+            "end": round(float(store.end_ms[-1]) / 60000, 3),
+            "runs": [
+                [round(start / 60000, 3), round(end / 60000, 3), int(state)]
+                for start, end, state in zip(starts.tolist(), ends.tolist(), run_states.tolist())
+            ],
+        }
+    
+    @staticmethod
+    def _merge_runs(
+        starts: np.ndarray,
+        ends: np.ndarray,
+        states: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Merge contiguous intervals that share a state."""
+        breaks = np.flatnonzero(
+            (states[1:] != states[:-1]) | (starts[1:] != ends[:-1])
+        ) + 1
+        first = np.concatenate(([0], breaks))
+        last = np.concatenate((breaks, [len(states)])) - 1
+        return starts[first], ends[last], states[first]
+    
+    @staticmethod
+    def _downsample(
+        store: UtteranceStore,
+        states: np.ndarray,
+        buckets: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Resample segment states onto equal-width buckets by majority duration."""
+        edges = np.linspace(store.start_ms[0], store.end_ms[-1], buckets + 1)
+        durations = store.duration_ms
         
-        fig.update_layout(
-            xaxis=dict(title="Time (minutes)", range=[min_time, max_time], tickmode="auto", nticks=10),
-            yaxis=dict(tickvals=[10], ticktext=["Engagement"], range=[0, 25]),
-            showlegend=True,
-            height=300,
-            width=800,
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            margin=dict(l=40, r=40, t=20, b=40),
-        )
+        coverage = np.stack([
+            np.diff(store.cumulative(durations * (states == state), edges))
+            for state in (NON_ENGAGING, ENGAGING, SILENT)
+        ])
+        covered = coverage.sum(axis=0) > 0
+        bucket_states = coverage.argmax(axis=0)
         
-        return fig.to_html(full_html=False)
-
+        return edges[:-1][covered], edges[1:][covered], bucket_states[covered]
@@ -0,0 +1,58 @@
+"""
+Per-analysis scratch directories for temporary audio artifacts.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+
+
+WORKSPACE_ROOT = Path(__file__).parent.parent.parent.parent / "data" / "audio"
+
+
+class AnalysisWorkspace:
+    """
+    Isolated working directory for a single analysis run.
+    
+    Each workspace gets a unique directory under ``root`` so concurrent
+    analyses never share file names, and the directory is removed with all
+    of its contents when the context exits, even if the analysis fails.
+    
+    Example:
+        with AnalysisWorkspace() as workspace:
+            processor = AudioProcessor(temp_dir=workspace.path)
+    """
+    
+    def __init__(self, root: Path | None = None, prefix: str = "job-") -> None:
+        self.root = root or WORKSPACE_ROOT
+        self.prefix = prefix
+        self._path: Path | None = None
+    
+    @property
+    def path(self) -> Path:
+        """Directory backing this workspace."""
+        if self._path is None:
+            raise RuntimeError("Workspace has not been opened")
+        return self._path
+    
+    def open(self) -> Path:
+        """Create the workspace directory."""
+        if self._path is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._path = Path(tempfile.mkdtemp(prefix=self.prefix, dir=self.root))
+        return self._path
+    
+    def close(self) -> None:
+        """Remove the workspace directory and everything in it."""
+        if self._path is not None:
+            shutil.rmtree(self._path, ignore_errors=True)
+            self._path = None
+    
+    def __enter__(self) -> AnalysisWorkspace:
+        self.open()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,99 @@
+"""
+Tests for the vectorized timeline metrics of UtteranceStore.
+"""
+
+import math
+from unittest import TestCase
+
+import numpy as np
+
+from core.services.emotion import ENGAGING_EMOTIONS
+from core.services.utterance_store import UtteranceStore
+
+
+# (start_ms, end_ms, words, is_speech, dominant emotion)
+SEGMENTS = [
+    (0, 20000, 40, True, "happy"),
+    (20000, 45000, 0, False, None),
+    (45000, 80000, 90, True, "sad"),
+    (80000, 95000, 20, True, "sad"),
+    (95000, 130000, 70, True, "calm"),
+    (130000, 150000, 0, False, None),
+    (150000, 200000, 120, True, "angry"),
+    (200000, 215000, 30, True, "happy"),
+]
+
+
+def _overlap(start: int, end: int, low: int, high: int) -> int:
+    return max(0, min(end, high) - max(start, low))
+
+
+def _store() -> UtteranceStore:
+    return UtteranceStore.from_columns(
+        start_ms=[s[0] for s in SEGMENTS],
+        end_ms=[s[1] for s in SEGMENTS],
+        word_counts=[s[2] for s in SEGMENTS],
+        question_counts=[0] * len(SEGMENTS),
+        is_speech=[s[3] for s in SEGMENTS],
+        emotions=[s[4] for s in SEGMENTS],
+        scores=[{s[4]: 1.0} if s[4] else None for s in SEGMENTS],
+    )
+
+
+def _edges(step_ms: int) -> list[int]:
+    end = SEGMENTS[-1][1]
+    return [*range(0, end, step_ms), end]
+
+
+class UtteranceStoreTimelineTests(TestCase):
+    def test_words_per_minute_matches_loop(self):
+        edges = _edges(60000)
+        expected = []
+        for low, high in zip(edges, edges[1:]):
+            words = sum(
+                count * _overlap(start, end, low, high) / (end - start)
+                for start, end, count, _, _ in SEGMENTS
+            )
+            expected.append(words / ((high - low) / 60000))
+        
+        minutes, wpm = _store().words_per_minute()
+        
+        np.testing.assert_allclose(minutes, [edge / 60000 for edge in edges[:-1]])
+        np.testing.assert_allclose(wpm, expected)
+    
+    def test_rolling_engagement_matches_loop(self):
+        window_ms, step_ms = 90000, 30000
+        ends = _edges(step_ms)[1:]
+        expected = []
+        for high in ends:
+            low = max(high - window_ms, SEGMENTS[0][0])
+            spoken = engaged = 0
+            for start, end, _, is_speech, emotion in SEGMENTS:
+                if not is_speech:
+                    continue
+                overlap = _overlap(start, end, low, high)
+                spoken += overlap
+                if emotion in ENGAGING_EMOTIONS:
+                    engaged += overlap
+            expected.append(engaged / spoken * 100 if spoken else math.nan)
+        
+        window_ends, engagement = _store().rolling_engagement(window_ms, step_ms)
+        
+        np.testing.assert_allclose(window_ends, [end / 60000 for end in ends])
+        np.testing.assert_allclose(engagement, expected)
+    
+    def test_emotion_transitions_match_loop(self):
+        store = _store()
+        spoken = [emotion for *_, is_speech, emotion in SEGMENTS if is_speech]
+        expected = np.zeros((len(store.labels), len(store.labels)), dtype=np.int32)
+        for before, after in zip(spoken, spoken[1:]):
+            expected[store.labels.index(before), store.labels.index(after)] += 1
+        
+        np.testing.assert_array_equal(store.emotion_transitions(), expected)
+    
+    def test_empty_store(self):
+        store = UtteranceStore.from_columns([], [], [], [], [], [], [])
+        
+        self.assertEqual(len(store.words_per_minute()[1]), 0)
+        self.assertEqual(len(store.rolling_engagement()[1]), 0)
+        self.assertFalse(store.emotion_transitions().any())
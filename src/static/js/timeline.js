@@ -0,0 +1,46 @@
+/**
+ * Draws engagement timelines from the compact run data stored per lecture.
+ *
+ * Data format: {start, end, runs: [[startMinute, endMinute, state], ...]}
+ * where state is 0 (non-engaging), 1 (engaging) or 2 (silent).
+ */
+const TIMELINE_STATES = [
+    {name: "Non-Engaging", color: "red"},
+    {name: "Engaging", color: "green"},
+    {name: "Silence", color: "lightgray"},
+];
+
+function renderTimeline(container, data) {
+    if (!data || !data.runs || data.runs.length === 0) {
+        container.innerHTML = '<p class="text-center text-muted">No visualization available</p>';
+        return;
+    }
+    
+    const shapes = data.runs.map(([start, end, state]) => ({
+        type: "rect",
+        x0: start, x1: end, y0: 4, y1: 16,
+        line: {color: TIMELINE_STATES[state].color},
+        fillcolor: TIMELINE_STATES[state].color,
+    }));
+    
+    // Silence only appears in the legend when the lecture has silent runs
+    const hasSilence = data.runs.some(run => run[2] === 2);
+    const legend = (hasSilence ? [1, 0, 2] : [1, 0]).map(index => ({
+        x: [null], y: [null], mode: "markers", type: "scatter",
+        marker: {size: 10, color: TIMELINE_STATES[index].color},
+        name: TIMELINE_STATES[index].name, showlegend: true,
+    }));
+    
+    container.innerHTML = "";
+    Plotly.newPlot(container, legend, {
+        shapes: shapes,
+        xaxis: {title: "Time (minutes)", range: [data.start, data.end], tickmode: "auto", nticks: 10},
+        yaxis: {tickvals: [10], ticktext: ["Engagement"], range: [0, 25]},
+        showlegend: true,
+        height: 300,
+        width: 800,
+        paper_bgcolor: "rgba(0,0,0,0)",
+        plot_bgcolor: "rgba(0,0,0,0)",
+        margin: {l: 40, r: 40, t: 20, b: 40},
+    }, {responsive: true});
+}